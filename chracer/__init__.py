@@ -1,19 +1,111 @@
-from xml.etree import ElementTree
+import os
+from chracer.symcache import SymbolCache, parse_path, primitive_size, array_type
 
 class ChromiumSymbols:
-    _chrome_dll_sym = ElementTree.parse('symbols/chrome.dll.pdb.xml')
-    _content_dll_sym = ElementTree.parse('symbols/content.dll.pdb.xml')
+    # used for the modules a symbol pack of the store does not cover
+    _DEFAULT_SYMBOLS = (
+        'symbols/chrome.dll.pdb.xml',
+        'symbols/content.dll.pdb.xml',
+    )
+    # opened lazily on the first lookup, searched in order
+    _sym_files = [SymbolCache(_) for _ in _DEFAULT_SYMBOLS]
+
+    # (kind, name) -> matching elements
+    _index = {}
+    # type name -> (size, alignment)
+    _sizes = {}
+    # symbol path -> chracer.interface.Layout
+    _layouts = {}
+
+    @classmethod
+    def use(cls, xml_paths: list):
+        for sym in ChromiumSymbols._sym_files: sym.close()
+        ChromiumSymbols._sym_files = [SymbolCache(_) for _ in xml_paths]
+        ChromiumSymbols._index = {}
+        ChromiumSymbols._sizes = {}
+        ChromiumSymbols._layouts = {}
+
+    @classmethod
+    def select(cls, mdmp, store: str='symbols'):
+        """switch to the symbol packs matching the modules of the dump; keeps the current set if none matches
+
+        The packs are searched first. A default symbol file stays in use (after the
+        packs) only when its module is loaded and no pack covers it.
+        """
+        from chracer.symstore import SymbolStore, read_modules
+
+        pack = SymbolStore(store).select(mdmp)
+        if pack:
+            loaded = set()
+            for module in read_modules(mdmp):
+                loaded.add((module.pdb_name or os.path.splitext(module.name)[0] + '.pdb').lower())
+            covered = set(os.path.basename(xml_path).lower() for module, xml_path in pack)
+
+            paths = [xml_path for module, xml_path in pack]
+            for xml_path in cls._DEFAULT_SYMBOLS:
+                name = os.path.basename(xml_path).lower()
+                if name not in covered and name[:-len('.xml')] in loaded: paths.append(xml_path)
+            cls.use(paths)
+        return [module for module, xml_path in pack]
+
+    @classmethod
+    def _lookup(cls, path: str):
+        parsed = parse_path(path)
+        if not parsed: return None
+
+        key = (parsed[1], parsed[2])
+        if key not in ChromiumSymbols._index:
+            ChromiumSymbols._index[key] = tuple()
+            for sym in ChromiumSymbols._sym_files:
+                _ = sym.findall(path)
+                if _:
+                    ChromiumSymbols._index[key] = tuple(_)
+                    break
+        return ChromiumSymbols._index[key]
+    
+    @classmethod
+    def type_size(cls, name: str):
+        _ = ChromiumSymbols._sizes.get(name)
+        if _ is not None: return _
+
+        _ = primitive_size(name)
+        array = None if _ else array_type(name)
+        if array:
+            size, align = cls.type_size(array[0]) # the element type may come from another file
+            _ = (size * array[1], align)
+        for sym in ChromiumSymbols._sym_files:
+            if _: break
+            _ = sym.type_size(name)
+        if not _: _ = (0, 1)
+
+        ChromiumSymbols._sizes[name] = _
+        return _
     
+    @classmethod
+    def vftables(cls, name: str):
+        """(PDB file name, base class or None, RVA) of the virtual function tables of a class"""
+        ret = []
+        for sym in ChromiumSymbols._sym_files:
+            if not os.path.exists(sym.xml_path): continue
+            pdb_name = os.path.basename(sym.xml_path)
+            if pdb_name.endswith('.xml'): pdb_name = pdb_name[:-4]
+            ret.extend((pdb_name, base, rva) for base, rva in sym.vftables(name))
+        return ret
+
     @classmethod
     def find(cls, path: str):
-        _ = ChromiumSymbols._chrome_dll_sym.find(path)
-        if _: return _
-        _ = ChromiumSymbols._content_dll_sym.find(path)
-        if _: return _
+        _ = cls._lookup(path)
+        if _ is not None: return _[0] if _ else None
+
+        for sym in ChromiumSymbols._sym_files:
+            _ = sym.find(path)
+            if _ is not None: return _
 
     @classmethod
     def findall(cls, path: str):
-        _ = ChromiumSymbols._chrome_dll_sym.findall(path)
-        if _: return _
-        _ = ChromiumSymbols._content_dll_sym.findall(path)
-        if _: return _
\ No newline at end of file
+        _ = cls._lookup(path)
+        if _ is not None: return list(_) if _ else None
+
+        for sym in ChromiumSymbols._sym_files:
+            _ = sym.findall(path)
+            if _: return _
\ No newline at end of file
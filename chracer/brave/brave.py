@@ -1,6 +1,8 @@
+import functools
 from enum import Enum
 from minidump.minidumpfile import MinidumpFile
 
+from chracer.chromium import has_navigation as _has_navigation
 from chracer.interface import ChromiumInstanceInterface, Field
 from chracer.tab import *
 from chracer.std import *
@@ -9,6 +11,7 @@ from chracer.gfx import *
 
 class BraveBrowser(ChromiumInstanceInterface):
     _INSTANCE_SIZE = 0x398
+    _SNAPSHOT = True
 
     class Type(Enum):
         TYPE_NORMAL = 0
@@ -317,4 +320,8 @@ class BraveFrameNavigationEntry(ChromiumInstanceInterface):
         return Vector(self._mdmp, self._redirect_chain.va, 120)
     @property
     def method(self):
-        return U8String(self._mdmp, self._method.va)
\ No newline at end of file
+        return U8String(self._mdmp, self._method.va)
+
+
+
+has_navigation = functools.partial(_has_navigation, tab_cls=BraveTab, entry_cls=BraveNavigationEntry)
@@ -0,0 +1,99 @@
+import os
+import re
+import json
+import time
+import hashlib
+
+# A scan records which of its tasks are done and what they found in a small
+# JSON file named after a fingerprint of the dump (SHA-256 of its size, mtime
+# and first and last blocks, hashing a whole multi-GB dump would take longer
+# than many scans) and the class scanned for, so an interrupted scan of the
+# same dump and class can skip the finished tasks. The fingerprint is only
+# computed once a checkpoint is read, written or cleared. The file also keeps
+# how the memory was cut into tasks, a resumed scan cuts it the same way.
+
+INTERVAL = 30 # seconds between two writes of the checkpoint
+_HASH_BLOCK = 1 << 20
+_UNSAFE = re.compile(r'[^\w.-]')
+
+
+
+def dump_hash(path: str) -> str:
+    st = os.stat(path)
+    h = hashlib.sha256('{0}:{1}'.format(st.st_size, st.st_mtime_ns).encode())
+    with open(path, 'rb') as f:
+        h.update(f.read(_HASH_BLOCK))
+        f.seek(max(st.st_size - _HASH_BLOCK, 0))
+        h.update(f.read(_HASH_BLOCK))
+    return h.hexdigest()
+
+class ScanCheckpoint:
+    def __init__(self, directory: str, dump_path: str, cls, interval: int=INTERVAL):
+        self.directory = directory
+        self.dump_path = dump_path
+        self._dump = None
+        self.cls = '{0}.{1}'.format(cls.__module__, cls.__qualname__)
+        self.interval = interval
+        self.chunk_bytes = None
+        self.target = None
+        self.done = {} # task index -> addresses found by the task
+        self._saved = time.monotonic()
+
+    @property
+    def dump(self) -> str:
+        if self._dump is None: self._dump = dump_hash(self.dump_path)
+        return self._dump
+
+    @property
+    def path(self) -> str:
+        return os.path.join(self.directory, '{0}.{1}.json'.format(self.dump, _UNSAFE.sub('_', self.cls)))
+
+    def load(self) -> bool:
+        """read a checkpoint of the same dump and class, False if there is none"""
+        try:
+            with open(self.path, 'r') as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return False
+        if state.get('dump') != self.dump or state.get('class') != self.cls: return False
+
+        self.chunk_bytes = state['chunk_bytes']
+        self.target = state['target']
+        self.done = {int(i): addresses for i, addresses in state['done'].items()}
+        return True
+
+    def record(self, i: int, addresses: list):
+        self.done[i] = addresses
+        if time.monotonic() - self._saved >= self.interval: self.save()
+
+    def save(self):
+        state = {
+            'dump': self.dump,
+            'class': self.cls,
+            'chunk_bytes': self.chunk_bytes,
+            'target': self.target,
+            'done': self.done,
+        }
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        tmp = self.path + '.tmp'
+        with open(tmp, 'w') as f:
+            json.dump(state, f)
+        os.replace(tmp, self.path) # never leave a half written checkpoint
+        self._saved = time.monotonic()
+
+    def clear(self):
+        """forget the progress, and delete the saved checkpoint, of this dump and class"""
+        self.chunk_bytes = None
+        self.target = None
+        self.done = {}
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
+
+    def remove(self):
+        if self._dump is None: return # never read or written
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
@@ -1,7 +1,9 @@
+import functools
 from enum import Enum
 from minidump.minidumpfile import MinidumpFile
 
-from chracer.interface import ChromiumInstanceInterface, Field
+from chracer.chromium import has_navigation as _has_navigation
+from chracer.interface import ChromiumInstanceInterface, Field, COST_SCALAR, COST_POINTER, COST_READ, COST_NESTED
 from chracer.tab import *
 from chracer.std import *
 from chracer.time import *
@@ -111,6 +113,36 @@ class ChromeBrowserCreateParams(ChromiumInstanceInterface):
 
 class ChromeBrowser(ChromiumInstanceInterface):
     _INSTANCE_SIZE = 1112
+    _SNAPSHOT = True
+    # stages of validate(), see ChromiumInstanceInterface.run_checks
+    _CHECKS = (
+        (COST_NESTED, 'create_params', lambda b, debug: b.create_params.validate(debug)),
+        (COST_READ, 'profile (create_params)', lambda b, debug: b.create_params.profile == b.profile),
+        (COST_SCALAR, 'type', lambda b, debug: b.type.value < 6),
+        (COST_POINTER, 'profile', lambda b, debug: validate_pointer(b._mdmp, b.profile, False) and validate_rw_page(b._mdmp, b.profile)),
+        (COST_POINTER, 'window', lambda b, debug: validate_pointer(b._mdmp, b.window, False) and validate_rw_page(b._mdmp, b.window)),
+        (COST_NESTED, 'tab_strip_model', lambda b, debug: b.tab_strip_model.validate(debug)),
+        (COST_READ, 'app_name', lambda b, debug: b.app_name.validate(debug)),
+        (COST_SCALAR, 'is_trusted_source', lambda b, debug: validate_boolean(convert_int(b._read_field(b._is_trusted_source)))),
+        (COST_SCALAR, 'session_id', lambda b, debug: b.session_id > 0),
+        (COST_SCALAR, 'should_trigger_session_restore', lambda b, debug: validate_boolean(convert_int(b._read_field(b._should_trigger_session_restore)))),
+        (COST_SCALAR, 'omit_from_session_restore', lambda b, debug: validate_boolean(convert_int(b._read_field(b._omit_from_session_restore)))),
+        (COST_SCALAR, 'cancel_download_confirmation_state', lambda b, debug: b.cancel_download_confirmation_state.value < 3),
+        (COST_READ, 'override_bounds', lambda b, debug: b.override_bounds.validate(debug)),
+        (COST_SCALAR, 'initial_show_state', lambda b, debug: b.initial_show_state.value < 7),
+        (COST_READ, 'initial_workspace', lambda b, debug: b.initial_workspace.validate(debug)),
+        (COST_SCALAR, 'initial_visible_on_all_workspace', lambda b, debug: validate_boolean(convert_int(b._read_field(b._initial_visible_on_all_workspace)))),
+        (COST_SCALAR, 'creation_source', lambda b, debug: b.creation_source.value < 5),
+        (COST_POINTER, 'live_tab_context', lambda b, debug: validate_pointer(b._mdmp, b.live_tab_context, False) and validate_rw_page(b._mdmp, b.live_tab_context)),
+        (COST_POINTER, 'instant_controller', lambda b, debug: validate_pointer(b._mdmp, b.instant_controller, False) and validate_rw_page(b._mdmp, b.instant_controller)),
+        (COST_POINTER, 'app_controller', lambda b, debug: validate_pointer(b._mdmp, b.app_controller)),
+        (COST_SCALAR, 'bookmark_bar_state', lambda b, debug: b.bookmark_bar_state.value < 2),
+        (COST_POINTER, 'exclusive_access_manager', lambda b, debug: validate_pointer(b._mdmp, b.exclusive_access_manager)),
+        (COST_POINTER, 'extension_window_controller', lambda b, debug: validate_pointer(b._mdmp, b.extension_window_controller)),
+        (COST_POINTER, 'command_controller', lambda b, debug: validate_pointer(b._mdmp, b.command_controller)),
+        (COST_SCALAR, 'window_has_shown', lambda b, debug: validate_boolean(convert_int(b._read_field(b._window_has_shown)))),
+        (COST_READ, 'user_title', lambda b, debug: b.user_title.validate(debug)),
+    )
 
     class Type(Enum):
         TYPE_NORMAL = 0
@@ -239,41 +271,7 @@ class ChromeBrowser(ChromiumInstanceInterface):
     def creation_timer(self): return TimeTicks(convert_int(self._read_field(self._creation_timer)))
 
     def validate(self, debug=False):
-        try:
-            assert self.create_params.validate(debug), "INVALID ChromeBrowser::CreateParams (create_params)"
-            assert self.create_params.profile == self.profile, 'INVLAID Profile (profile is not same to create_params.profile)'
-            assert self.type.value < 6, "INVALID Type (type)"
-            assert validate_pointer(self._mdmp, self.profile, False), "INVALID POINTER VALUE (profile)"
-            assert validate_rw_page(self._mdmp, self.profile), "INVALID PAGE (profile)"
-            assert validate_pointer(self._mdmp, self.window, False), 'INVALID POINTER VALUE (window)'
-            assert validate_rw_page(self._mdmp, self.window), "INVALID PAGE (window)"
-            assert self.tab_strip_model.validate(debug), "INVALID TabStripModel (tab_strip_model)"
-            assert self.app_name.validate(debug), "INVALID std::string (app_name)"
-            assert validate_boolean(convert_int(self._read_field(self._is_trusted_source))), "INVLAID bool (is_trusted_source)"
-            assert self.session_id > 0, "INVALID SessionID (session_id)"
-            assert validate_boolean(convert_int(self._read_field(self._should_trigger_session_restore))), "INVLAID bool (should_trigger_session_restore)"
-            assert validate_boolean(convert_int(self._read_field(self._omit_from_session_restore))), "INVLAID bool (omit_from_session_restore)"
-            assert self.cancel_download_confirmation_state.value < 3, "INVALID CancelDownloadConfirmationState (cancel_download_confirmation_state)"
-            assert self.override_bounds.validate(debug), "INVALID gfx::Rect (override_bounds)"
-            assert self.initial_show_state.value < 7, "INVALID WindowShowState (initial_show_state)"
-            assert self.initial_workspace.validate(debug), "INVALID std::string (initial_workspace)"
-            assert validate_boolean(convert_int(self._read_field(self._initial_visible_on_all_workspace))), "INVLAID bool (initial_visible_on_all_workspace)"
-            assert self.creation_source.value < 5, "INVALID CreationSource (creation_source)"
-            assert validate_pointer(self._mdmp, self.live_tab_context, False), 'INVALID POINTER VALUE (live_tab_context)'
-            assert validate_rw_page(self._mdmp, self.live_tab_context), "INVALID PAGE (live_tab_context)"
-            assert validate_pointer(self._mdmp, self.instant_controller, False), "INVALID POINTER VALUE (instant_controller)"
-            assert validate_rw_page(self._mdmp, self.instant_controller), "INVALID PAGE (instant_controller)"
-            assert validate_pointer(self._mdmp, self.app_controller), "INVALID POINTER VALUE (app_controller)"
-            assert self.bookmark_bar_state.value < 2, "INVALID BookmarkBarState (bookmark_bar_state)"
-            assert validate_pointer(self._mdmp, self.exclusive_access_manager), "INVALID POINTER VALUE (exclusive_access_manager)"
-            assert validate_pointer(self._mdmp, self.extension_window_controller), "INVALID POINTER VALUE (extension_window_controller)"
-            assert validate_pointer(self._mdmp, self.command_controller), "INVALID POINTER VALUE (command_controller)"
-            assert validate_boolean(convert_int(self._read_field(self._window_has_shown))), "INVLAID bool (window_has_shown)"
-            assert self.user_title.validate(debug), "INVALID std::string (user_title)"
-        except Exception as e:
-            if debug: print('ChromeBrowser-> 0x{0:X} {1}'.format(self.base, e))
-            return False
-        return True
+        return self.run_checks(debug)
 
 
 
@@ -413,4 +411,8 @@ class ChromeFrameNavigationEntry(ChromiumInstanceInterface):
         return Vector(self._mdmp, self._redirect_chain.va, 120)
     @property
     def method(self):
-        return U8String(self._mdmp, self._method.va)
\ No newline at end of file
+        return U8String(self._mdmp, self._method.va)
+
+
+
+has_navigation = functools.partial(_has_navigation, tab_cls=ChromeTab, entry_cls=ChromeNavigationEntry)
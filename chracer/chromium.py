@@ -2,7 +2,7 @@ from minidump.minidumpfile import MinidumpFile
 from enum import Enum
 
 from chracer.validator import *
-from chracer.interface import ChromiumInstanceInterface
+from chracer.interface import ChromiumInstanceInterface, prime, COST_SCALAR, COST_POINTER, COST_READ, COST_NESTED
 from chracer.gfx import *
 from chracer.std import *
 from chracer.tab import *
@@ -17,73 +17,73 @@ class BrowserCreateParam(ChromiumInstanceInterface):
     
     def __getattr__(self, name):
         if name == 'type':
-            return Browser.Type(convert_int(self._read_field(self._type)))
+            return Browser.Type(self._value(self._type))
         if name == 'profile':
-            return convert_int(self._read_field(self._profile))
+            return self._value(self._profile)
         if name == 'trusted_source':
-            return convert_bool(self._read_field(self._trusted_source))
+            return bool(self._value(self._trusted_source))
         if name == 'omit_from_session_restore':
-            return convert_bool(self._read_field(self._omit_from_session_restore))
+            return bool(self._value(self._omit_from_session_restore))
         if name == 'should_trigger_session_restore':
-            return convert_bool(self._read_field(self._should_trigger_session_restore))
+            return bool(self._value(self._should_trigger_session_restore))
         if name == 'initial_bounds':
             return Rect(self._mdmp, self._initial_bounds.va)
         if name == 'initial_origin_specified':
-            return Browser.ValueSpecified(convert_int(self._read_field(self._initial_origin_specified)))
+            return Browser.ValueSpecified(self._value(self._initial_origin_specified))
         if name == 'initial_workspace':
             return U8String(self._mdmp, self._initial_workspace.va)
         if name == 'initial_visible_on_all_workspaces_state':
-            return convert_bool(self._read_field(self._initial_visible_on_all_workspaces_state))
+            return bool(self._value(self._initial_visible_on_all_workspaces_state))
         if name == 'are_tab_groups_enabled':
-            return convert_bool(self._read_field(self._are_tab_groups_enabled))
+            return bool(self._value(self._are_tab_groups_enabled))
         if name == 'initial_show_state':
-            return Browser.WindowShowState(convert_int(self._read_field(self._initial_show_state)))
+            return Browser.WindowShowState(self._value(self._initial_show_state))
         if name == 'creation_source':
-            return Browser.CreationSource(convert_int(self._read_field(self._creation_source)))
+            return Browser.CreationSource(self._value(self._creation_source))
         if name == 'user_gesture':
-            return convert_bool(self._read_field(self._user_gesture))
+            return bool(self._value(self._user_gesture))
         if name == 'in_tab_dragging':
-            return convert_bool(self._read_field(self._in_tab_dragging))
+            return bool(self._value(self._in_tab_dragging))
         if name == 'window':
-            return convert_int(self._read_field(self._window))
+            return self._value(self._window)
         if name == 'user_title':
             return U8String(self._mdmp, self._user_title.va)
         if name == 'can_resize':
-            return convert_bool(self._read_field(self._can_resize))
+            return bool(self._value(self._can_resize))
         if name == 'can_maximize':
-            return convert_bool(self._read_field(self._can_maximize))
+            return bool(self._value(self._can_maximize))
         if name == 'initial_aspect_ratio':
             return convert_float(self._read_field(self._initial_aspect_ratio))
         if name == 'lock_aspect_ratio':
-            return convert_bool(self._read_field(self._lock_aspect_ratio))
+            return bool(self._value(self._lock_aspect_ratio))
         if name == 'app_name':
             return U8String(self._mdmp, self._app_name.va)
         if name == 'skip_window_init_for_testing':
-            return convert_bool(self._read_field(self._skip_window_init_for_testing))
+            return bool(self._value(self._skip_window_init_for_testing))
 
     def validate(self, debug=False):
         try:
             assert self.type.value < 6, 'INVALID Type'
             assert validate_pointer(self._mdmp, self.profile, False), 'INVALID POINTER VALUE'
-            assert validate_boolean(convert_int(self._read_field((self._trusted_source)))), 'INVALID bool'
-            assert validate_boolean(convert_int(self._read_field((self._omit_from_session_restore)))), 'INVALID bool'
-            assert validate_boolean(convert_int(self._read_field((self._should_trigger_session_restore)))), 'INVALID bool'
+            assert validate_boolean(self._value(self._trusted_source)), 'INVALID bool'
+            assert validate_boolean(self._value(self._omit_from_session_restore)), 'INVALID bool'
+            assert validate_boolean(self._value(self._should_trigger_session_restore)), 'INVALID bool'
             assert self.initial_bounds.validate(debug), 'INVALID gfx::Rect'
             assert self.initial_origin_specified.value < 3, 'INVALID ValueSpecified value'
             assert self.initial_workspace.validate(debug), 'INVALID std::string'
-            assert validate_boolean(convert_int(self._read_field((self._initial_visible_on_all_workspaces_state)))), 'INVALID bool'
-            assert validate_boolean(convert_int(self._read_field((self._are_tab_groups_enabled)))), 'INVALID bool'
+            assert validate_boolean(self._value(self._initial_visible_on_all_workspaces_state)), 'INVALID bool'
+            assert validate_boolean(self._value(self._are_tab_groups_enabled)), 'INVALID bool'
             assert self.initial_show_state.value < 6, 'INVALID WindowShowState value'
             assert self.creation_source.value < 5, 'INVALID CreationSource value'
-            assert validate_boolean(convert_int(self._read_field((self._user_gesture)))), 'INVALID bool'
-            assert validate_boolean(convert_int(self._read_field((self._in_tab_dragging)))), 'INVALID bool'
+            assert validate_boolean(self._value(self._user_gesture)), 'INVALID bool'
+            assert validate_boolean(self._value(self._in_tab_dragging)), 'INVALID bool'
             assert validate_pointer(self._mdmp, self.window), 'INVALID POINTER VALUE'
             assert self.user_title.validate(debug), 'INVALID std::string'
-            assert validate_boolean(convert_int(self._read_field((self._can_resize)))), 'INVALID bool'
-            assert validate_boolean(convert_int(self._read_field((self._can_maximize)))), 'INVALID bool'
-            assert validate_boolean(convert_int(self._read_field((self._lock_aspect_ratio)))), 'INVALID bool'
+            assert validate_boolean(self._value(self._can_resize)), 'INVALID bool'
+            assert validate_boolean(self._value(self._can_maximize)), 'INVALID bool'
+            assert validate_boolean(self._value(self._lock_aspect_ratio)), 'INVALID bool'
             assert self.app_name.validate(debug), 'INVALID std::string'
-            assert validate_boolean(convert_int(self._read_field((self._skip_window_init_for_testing)))), 'INVALID bool'
+            assert validate_boolean(self._value(self._skip_window_init_for_testing)), 'INVALID bool'
         except Exception as e:
             if debug: print('Browser::CreateParams -> 0x{0:X} {1}'.format(self.base, e))
             return False
@@ -93,6 +93,66 @@ class BrowserCreateParam(ChromiumInstanceInterface):
 
 class Browser(ChromiumInstanceInterface):
     _INSTANCE_SIZE = 1112
+    _SNAPSHOT = True
+    # necessary conditions of validate(), see chracer.scanner
+    _PREFILTER = {
+        'booleans': ('_is_trusted_source', '_omit_from_session_restore', '_should_trigger_session_restore',
+            '_initial_visible_on_all_workspaces_state', '_window_has_shown', '_force_skip_warning_user_on_close'),
+        'enums': {'_type': 6, '_cancel_download_confirmation_state': 3, '_initial_show_state': 6,
+            '_creation_source': 5, '_bookmark_bar_state': 2},
+        'nonzero': ('_session_id', ),
+        'pointers': ('_profile', '_window', '_tab_strip_model', '_live_tab_context'),
+        'nullable_pointers': ('_profile_keep_alive', '_tab_strip_model_delegate', '_tab_menu_model_delegate',
+            '_location_bar_model', '_find_bar_controller', '_select_file_dialog',
+            '_content_setting_bubble_model_delegate', '_synced_window_delegate', '_instant_controller',
+            '_app_controller', '_exclusive_access_manager', '_extension_window_controller', '_command_controller',
+            '_breadcrumb_manager_browser_agent', '_keep_alive', '_warn_before_closing_callback',
+            '_extension_browser_window_helper', '_opener_browser'),
+    }
+
+    # stages of validate(), see ChromiumInstanceInterface.run_checks
+    _CHECKS = (
+        (COST_NESTED, 'create_params', lambda b, debug: b.create_params.validate(debug)),
+        (COST_SCALAR, 'type', lambda b, debug: b.type.value < 6),
+        (COST_POINTER, 'profile', lambda b, debug: validate_pointer(b._mdmp, b._value(b._profile), False)),
+        (COST_POINTER, 'profile_keep_alive', lambda b, debug: validate_pointer(b._mdmp, b.profile_keep_alive)),
+        (COST_POINTER, 'window', lambda b, debug: validate_pointer(b._mdmp, b.window, False)),
+        (COST_POINTER, 'tab_strip_model_delegate', lambda b, debug: validate_pointer(b._mdmp, b.tab_strip_model_delegate)),
+        (COST_POINTER, 'tab_strip_model', lambda b, debug: validate_pointer(b._mdmp, b._value(b._tab_strip_model), False)),
+        (COST_NESTED, 'tab_strip_model.validate', lambda b, debug: b.tab_strip_model.validate(debug)),
+        (COST_POINTER, 'tab_menu_model_delegate', lambda b, debug: validate_pointer(b._mdmp, b.tab_menu_model_delegate)),
+        (COST_READ, 'app_name', lambda b, debug: b.app_name.validate(debug)),
+        (COST_SCALAR, 'is_trusted_source', lambda b, debug: validate_boolean(b._value(b._is_trusted_source))),
+        (COST_SCALAR, 'session_id', lambda b, debug: b.session_id > 0),
+        (COST_SCALAR, 'omit_from_session_restore', lambda b, debug: validate_boolean(b._value(b._omit_from_session_restore))),
+        (COST_SCALAR, 'should_trigger_session_restore', lambda b, debug: validate_boolean(b._value(b._should_trigger_session_restore))),
+        (COST_POINTER, 'location_bar_model', lambda b, debug: validate_pointer(b._mdmp, b.location_bar_model)),
+        (COST_SCALAR, 'cancel_download_confirmation_state', lambda b, debug: b.cancel_download_confirmation_state.value < 3),
+        (COST_READ, 'override_bounds', lambda b, debug: b.override_bounds.validate(debug)),
+        (COST_SCALAR, 'initial_show_state', lambda b, debug: b.initial_show_state.value < 6),
+        (COST_READ, 'initial_workspace', lambda b, debug: b.initial_workspace.validate(debug)),
+        (COST_SCALAR, 'initial_visible_on_all_workspaces_state', lambda b, debug: validate_boolean(b._value(b._initial_visible_on_all_workspaces_state))),
+        (COST_SCALAR, 'creation_source', lambda b, debug: b.creation_source.value < 5),
+        (COST_POINTER, 'find_bar_controller', lambda b, debug: validate_pointer(b._mdmp, b.find_bar_controller)),
+        (COST_POINTER, 'select_file_dialog', lambda b, debug: validate_pointer(b._mdmp, b.select_file_dialog)),
+        (COST_POINTER, 'content_setting_bubble_model_delegate', lambda b, debug: validate_pointer(b._mdmp, b.content_setting_bubble_model_delegate)),
+        (COST_POINTER, 'live_tab_context', lambda b, debug: validate_pointer(b._mdmp, b.live_tab_context, False)),
+        (COST_POINTER, 'synced_window_delegate', lambda b, debug: validate_pointer(b._mdmp, b.synced_window_delegate)),
+        (COST_POINTER, 'instant_controller', lambda b, debug: validate_pointer(b._mdmp, b.instant_controller)),
+        (COST_POINTER, 'app_controller', lambda b, debug: validate_pointer(b._mdmp, b.app_controller)),
+        (COST_SCALAR, 'bookmark_bar_state', lambda b, debug: b.bookmark_bar_state.value < 2),
+        (COST_POINTER, 'exclusive_access_manager', lambda b, debug: validate_pointer(b._mdmp, b.exclusive_access_manager)),
+        (COST_POINTER, 'extension_window_controller', lambda b, debug: validate_pointer(b._mdmp, b.extension_window_controller)),
+        (COST_POINTER, 'command_controller', lambda b, debug: validate_pointer(b._mdmp, b.command_controller)),
+        (COST_SCALAR, 'window_has_shown', lambda b, debug: validate_boolean(b._value(b._window_has_shown))),
+        (COST_READ, 'user_title', lambda b, debug: b.user_title.validate(debug)),
+        (COST_POINTER, 'breadcrumb_manager_browser_agent', lambda b, debug: validate_pointer(b._mdmp, b.breadcrumb_manager_browser_agent)),
+        (COST_POINTER, 'keep_alive', lambda b, debug: validate_pointer(b._mdmp, b.keep_alive)),
+        (COST_POINTER, 'warn_before_closing_callback', lambda b, debug: validate_pointer(b._mdmp, b.warn_before_closing_callback)),
+        (COST_SCALAR, 'force_skip_warning_user_on_close', lambda b, debug: validate_boolean(b._value(b._force_skip_warning_user_on_close))),
+        (COST_POINTER, 'extension_browser_window_helper', lambda b, debug: validate_pointer(b._mdmp, b.extension_browser_window_helper)),
+        (COST_POINTER, 'opener_browser', lambda b, debug: validate_pointer(b._mdmp, b.opener_browser)),
+    )
 
     class Type(Enum):
         TYPE_NORMAL = 0
@@ -140,132 +200,153 @@ class Browser(ChromiumInstanceInterface):
         if name == 'create_params':
             return BrowserCreateParam(self._mdmp, self._create_params.va)
         if name == 'type':
-            return self.Type(convert_int(self._read_field(self._type)))
+            return self.Type(self._value(self._type))
         if name == 'profile':
-            _ = convert_int(self._read_field(self._profile))
+            _ = self._value(self._profile)
             if Profile(self._mdmp, _).validate(): return Profile(self._mdmp, _)
             if OffTheRecordProfile(self._mdmp, _).validate(): return OffTheRecordProfile(self._mdmp, _)
             return None
         if name == 'profile_keep_alive':
-            return convert_int(self._read_field(self._profile_keep_alive))
+            return self._value(self._profile_keep_alive)
         if name == 'window':
-            return convert_int(self._read_field(self._window))
+            return self._value(self._window)
         if name == 'tab_strip_model_delegate':
-            return convert_int(self._read_field(self._tab_strip_model_delegate))
+            return self._value(self._tab_strip_model_delegate)
         if name == 'tab_strip_model':
-            return TabStripModel(self._mdmp, convert_int(self._read_field(self._tab_strip_model)))
+            return TabStripModel(self._mdmp, self._value(self._tab_strip_model))
         if name == 'tab_menu_model_delegate':
-            return convert_int(self._read_field(self._tab_menu_model_delegate))
+            return self._value(self._tab_menu_model_delegate)
         if name == 'app_name':
             return U8String(self._mdmp, self._app_name.va)
         if name == 'is_trusted_source':
-            return convert_bool(self._read_field(self._is_trusted_source))
+            return bool(self._value(self._is_trusted_source))
         if name == 'session_id':
-            return convert_int(self._read_field(self._session_id))
+            return self._value(self._session_id)
         if name == 'omit_from_session_restore':
-            return convert_bool(self._read_field(self._omit_from_session_restore))
+            return bool(self._value(self._omit_from_session_restore))
         if name == 'should_trigger_session_restore':
-            return convert_bool(self._read_field(self._should_trigger_session_restore))
+            return bool(self._value(self._should_trigger_session_restore))
         if name == 'cancel_download_confirmation_state':
-            return self.CancelDownloadConfirmationState(convert_int(self._read_field(self._cancel_download_confirmation_state)))
+            return self.CancelDownloadConfirmationState(self._value(self._cancel_download_confirmation_state))
         if name == 'override_bounds':
             return Rect(self._mdmp, self._override_bounds.va)
         if name == 'initial_show_state':
-            return self.WindowShowState(convert_int(self._read_field(self._initial_show_state)))
+            return self.WindowShowState(self._value(self._initial_show_state))
         if name == 'initial_workspace':
             return U8String(self._mdmp, self._initial_workspace.va)
         if name == 'initial_visible_on_all_workspaces_state':
-            return convert_int(self._read_field(self._initial_visible_on_all_workspaces_state))
+            return self._value(self._initial_visible_on_all_workspaces_state)
         if name == 'creation_source':
-            return self.CreationSource(convert_int(self._read_field(self._creation_source)))
+            return self.CreationSource(self._value(self._creation_source))
         if name == 'find_bar_controller':
-            return convert_int(self._read_field(self._find_bar_controller))
+            return self._value(self._find_bar_controller)
         if name == 'select_file_dialog':
-            return convert_int(self._read_field(self._select_file_dialog))
+            return self._value(self._select_file_dialog)
         if name == 'content_setting_bubble_model_delegate':
-            return convert_int(self._read_field(self._content_setting_bubble_model_delegate))
+            return self._value(self._content_setting_bubble_model_delegate)
         if name == 'location_bar_model':
-            return convert_int(self._read_field(self._location_bar_model))
+            return self._value(self._location_bar_model)
         if name == 'live_tab_context':
-            return convert_int(self._read_field(self._live_tab_context))
+            return self._value(self._live_tab_context)
         if name == 'synced_window_delegate':
-            return convert_int(self._read_field(self._synced_window_delegate))
+            return self._value(self._synced_window_delegate)
         if name == 'instant_controller':
-            return convert_int(self._read_field(self._instant_controller))
+            return self._value(self._instant_controller)
         if name == 'app_controller':
-            return convert_int(self._read_field(self._app_controller))
+            return self._value(self._app_controller)
         if name == 'bookmark_bar_state':
-            return self.BookmarkBarState(convert_int(self._read_field(self._bookmark_bar_state)))
+            return self.BookmarkBarState(self._value(self._bookmark_bar_state))
         if name == 'exclusive_access_manager':
-            return convert_int(self._read_field(self._exclusive_access_manager))
+            return self._value(self._exclusive_access_manager)
         if name == 'extension_window_controller':
-            return convert_int(self._read_field(self._extension_window_controller))
+            return self._value(self._extension_window_controller)
         if name == 'command_controller':
-            return convert_int(self._read_field(self._command_controller))
+            return self._value(self._command_controller)
         if name == 'window_has_shown':
-            return convert_bool(self._read_field(self._window_has_shown))
+            return bool(self._value(self._window_has_shown))
         if name == 'user_title':
             return U8String(self._mdmp, self._user_title.va)
         if name == 'breadcrumb_manager_browser_agent':
-            return convert_int(self._read_field(self._breadcrumb_manager_browser_agent))
+            return self._value(self._breadcrumb_manager_browser_agent)
         if name == 'keep_alive':
-            return convert_int(self._read_field(self._keep_alive))
+            return self._value(self._keep_alive)
         if name == 'warn_before_closing_callback':
-            return convert_int(self._read_field(self._warn_before_closing_callback))
+            return self._value(self._warn_before_closing_callback)
         if name == 'force_skip_warning_user_on_close':
-            return convert_bool(self._read_field(self._force_skip_warning_user_on_close))
+            return bool(self._value(self._force_skip_warning_user_on_close))
         if name == 'extension_browser_window_helper':
-            return convert_int(self._read_field(self._extension_browser_window_helper))
+            return self._value(self._extension_browser_window_helper)
         if name == 'creation_timer':
-            return TimeTicks(convert_int(self._read_field(self._creation_timer)))
+            return TimeTicks(self._value(self._creation_timer))
         if name == 'opener_browser':
-            return convert_int(self._read_field(self._opener_browser))
+            return self._value(self._opener_browser)
         return None
 
     def validate(self, debug=False):
+        return self.run_checks(debug)
+
+
+
+def has_navigation(browser: ChromiumInstanceInterface, tab_cls=Tab, entry_cls=NavigationEntry) -> bool:
+    """the first tab of the browser and the first navigation entry of that tab validate as well
+
+    The browser modules bind it to their own tab and navigation entry classes.
+    """
+    tabs = browser.tab_strip_model.contents_data.entries
+    if len(tabs) < 1: return False
+
+    tab = tab_cls(browser._mdmp, int.from_bytes(tabs[0], 'little'))
+    if not tab.validate(): return False
+
+    entries = tab.contents.primary_frame_tree.navigator.controller.entries.entries
+    if len(entries) < 1: return False
+    return entry_cls(browser._mdmp, int.from_bytes(entries[0], 'little')).validate()
+
+def _vector_pointers(vectors: list):
+    """the 8-byte entries of many std::vector at once"""
+    requests = []
+    for v in vectors:
         try:
-            assert self.create_params.validate(debug), 'INVALID Browser::CreateParams'
-            assert self.type.value < 6, 'INVALID Type'
-            assert validate_pointer(self._mdmp, convert_int(self._read_field(self._profile)), False), 'INVALID POINTER VALUE'
-            assert validate_pointer(self._mdmp, self.profile_keep_alive), 'INVALID POINTER VALUE'
-            assert validate_pointer(self._mdmp, self.window, False), 'INVALID POINTER VALUE'
-            assert validate_pointer(self._mdmp, self.tab_strip_model_delegate), 'INVALID POINTER VALUE'
-            assert validate_pointer(self._mdmp, convert_int(self._read_field(self._tab_strip_model)), False), 'INVALID POINTER VALUE'
-            assert self.tab_strip_model.validate(debug), 'INVALID TabStripModel'
-            assert validate_pointer(self._mdmp, self.tab_menu_model_delegate), 'INVALID POINTER VALUE'
-            assert self.app_name.validate(debug), 'INVALID std::string'
-            assert validate_boolean(convert_int(self._read_field(self._is_trusted_source))), 'INVALID bool'
-            assert self.session_id > 0, 'INVALID SessionID'
-            assert validate_boolean(convert_int(self._read_field(self._omit_from_session_restore))), 'INVALID bool'
-            assert validate_boolean(convert_int(self._read_field(self._should_trigger_session_restore))), 'INVALID bool'
-            assert validate_pointer(self._mdmp, self.location_bar_model), 'INVALID POINTER VALUE'
-            assert self.cancel_download_confirmation_state.value < 3, 'INVALID CancelDownloadConfirmationState'
-            assert self.override_bounds.validate(debug), 'INVALID gfx::Rect'
-            assert self.initial_show_state.value < 6, 'INVALID WindowShowState value'
-            assert self.initial_workspace.validate(debug), 'INVALID std::string'
-            assert validate_boolean(convert_int(self._read_field(self._initial_visible_on_all_workspaces_state))), 'INVALID bool'
-            assert self.creation_source.value < 5, 'INVALID CreationSource value'
-            assert validate_pointer(self._mdmp, self.find_bar_controller), 'INVALID POINTER VALUE'
-            assert validate_pointer(self._mdmp, self.select_file_dialog), 'INVALID POINTER VALUE'
-            assert validate_pointer(self._mdmp, self.content_setting_bubble_model_delegate), 'INVALID POINTER VALUE'
-            assert validate_pointer(self._mdmp, self.location_bar_model), 'INVALID POINTER VALUE'
-            assert validate_pointer(self._mdmp, self.live_tab_context, False), 'INVALID POINTER VALUE'
-            assert validate_pointer(self._mdmp, self.synced_window_delegate), 'INVALID POINTER VALUE'
-            assert validate_pointer(self._mdmp, self.instant_controller), 'INVALID POINTER VALUE'
-            assert validate_pointer(self._mdmp, self.app_controller), 'INVALID POINTER VALUE'
-            assert self.bookmark_bar_state.value < 2, 'it is invlaid BookmarkBar::State value'
-            assert validate_pointer(self._mdmp, self.exclusive_access_manager), 'INVALID POINTER VALUE'
-            assert validate_pointer(self._mdmp, self.extension_window_controller), 'INVALID POINTER VALUE'
-            assert validate_pointer(self._mdmp, self.command_controller), 'INVALID POINTER VALUE'
-            assert validate_boolean(convert_int(self._read_field(self._window_has_shown))), 'INVALID bool'
-            assert self.user_title.validate(debug), 'INVALID std::string'
-            assert validate_pointer(self._mdmp, self.breadcrumb_manager_browser_agent), 'INVALID POINTER VALUE'
-            assert validate_pointer(self._mdmp, self.keep_alive), 'INVALID POINTER VALUE'
-            assert validate_pointer(self._mdmp, self.warn_before_closing_callback), 'INVALID POINTER VALUE'
-            assert validate_boolean(convert_int(self._read_field(self._force_skip_warning_user_on_close))), 'INVALID bool'
-            assert validate_pointer(self._mdmp, self.extension_browser_window_helper), 'INVALID POINTER VALUE'
-            assert validate_pointer(self._mdmp, self.opener_browser), 'INVALID POINTER VALUE'
-        except Exception as e:
-            if debug: print('Browser -> 0x{0:X} {1}'.format(self.base, e))
-            return False
-        return True
\ No newline at end of file
+            begin, end = v.begin, v.end
+        except Exception:
+            begin, end = 0, 0
+        ok = begin != 0 and begin <= end and (end - begin) % 8 == 0
+        requests.append((begin, end - begin) if ok else (0, 0))
+
+    buffers = vectors[0]._ci_reader.read_many(requests) if vectors else []
+    return [[convert_int(b[i:i+8]) for i in range(0, len(b), 8)] if b else [] for b in buffers]
+
+def walk_entries(mdmp: MinidumpFile, browsers: list):
+    """(browser, tab index, NavigationEntry, FrameNavigationEntry) of every navigation entry of the browsers
+
+    The objects are read level by level (browsers, tab strips, tabs, web
+    contents, ..., frame entries) and every level is fetched by one batched
+    read instead of one read per object and hop.
+    """
+    prime(browsers)
+    tab_strips = prime([b.tab_strip_model for b in browsers])
+    tab_pointers = _vector_pointers(prime([t.contents_data for t in tab_strips]))
+
+    tabs = [(b, i, Tab(mdmp, p))
+        for b, pointers in zip(browsers, tab_pointers)
+        for i, p in enumerate(pointers) if validate_pointer(mdmp, p, False)]
+    prime([t for b, i, t in tabs])
+
+    contents = prime([t.contents for b, i, t in tabs])
+    tabs = [(b, i, w) for (b, i, t), w in zip(tabs, contents) if validate_pointer(mdmp, w.base, False)]
+    controllers = prime([w.primary_frame_tree for b, i, w in tabs])
+    controllers = prime([f.navigator for f in controllers])
+    controllers = prime([n.controller for n in controllers])
+    entry_pointers = _vector_pointers(prime([c.entries for c in controllers]))
+
+    entries = [(b, i, NavigationEntry(mdmp, p))
+        for (b, i, w), pointers in zip(tabs, entry_pointers)
+        for p in pointers if validate_pointer(mdmp, p, False)]
+    prime([e for b, i, e in entries])
+
+    nodes = prime([e.frame_tree for b, i, e in entries])
+    entries = [(b, i, e, n) for (b, i, e), n in zip(entries, nodes) if validate_pointer(mdmp, n.base, False)]
+    frame_entries = prime([n.frame_entry for b, i, e, n in entries])
+
+    for (b, i, e, n), fe in zip(entries, frame_entries):
+        if validate_pointer(mdmp, fe.base, False): yield b, i, e, fe
@@ -14,22 +14,7 @@ def convert_bool(data: bytes) -> bool:
     return True if convert_int(data) else False
 
 def get_type_size(type_name: str) -> int:
-    if type_name == 'bool':
-        return 1
-    elif type_name == 'short':
-        return 2
-    elif type_name == 'int':
-        return 4
-    elif type_name == 'float':
-        return 4
-    elif type_name == 'double':
-        return 8
-    
-    e = ChromiumSymbols.find('./enums/enum[@name="{}"]'.format(type_name))
-    if e: return int(e.attrib.get('length'), base=16)
-    c = ChromiumSymbols.find('./classes/class[@name="{}"]'.format(type_name))
-    if c: return int(c.attrib.get('length'), base=16)
-    d = ChromiumSymbols.find('./datatypes/datatype[@name="{}"]'.format(type_name))
-    if d: return int(d.attrib.get('length'), base=16)
+    return ChromiumSymbols.type_size(type_name)[0]
 
-    return 0
+def get_type_alignment(type_name: str) -> int:
+    return ChromiumSymbols.type_size(type_name)[1]
\ No newline at end of file
@@ -0,0 +1,197 @@
+import io
+import zlib
+import bisect
+import struct
+import collections
+
+# Compressed minidumps are read in place. Both formats are split into blocks
+# that can be decompressed on their own, and only the blocks that are read
+# are decompressed, kept in an LRU cache with a byte budget.
+#
+#   gzip: the file is decompressed once to build an in-memory index holding a
+#         copy of the decompressor state every `span` bytes of output.
+#   zstd: seekable format (frames + seek table), needs the zstandard package.
+
+GZIP_MAGIC = b'\x1f\x8b'
+ZSTD_MAGIC = b'\x28\xb5\x2f\xfd'
+ZSTD_SEEKABLE_MAGIC = 0x8F92EAB1
+ZSTD_SKIPPABLE_MAGIC = 0x184D2A5E
+
+SPAN = 4 << 20
+CACHE_BYTES = 256 << 20
+_CHUNK = 64 << 10
+
+
+
+class BlockFile(io.RawIOBase):
+    def __init__(self, path: str, cache_bytes: int=CACHE_BYTES):
+        super().__init__()
+        self.name = path
+        self._file = open(path, 'rb')
+        self._starts = []   # uncompressed offset of every block
+        self._sizes = []    # uncompressed size of every block
+        self._cache = collections.OrderedDict()
+        self._pos = 0
+        self.cache_bytes = cache_bytes
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def size(self):
+        return self._starts[-1] + self._sizes[-1] if self._starts else 0
+
+    def _load(self, i: int) -> bytes:
+        raise NotImplementedError
+
+    def _block(self, i: int) -> bytes:
+        data = self._cache.get(i)
+        if data is not None:
+            self._cache.move_to_end(i)
+            self.hits += 1
+            return data
+
+        self.misses += 1
+        data = self._cache[i] = self._load(i)
+        cached = sum(len(_) for _ in self._cache.values())
+        while cached > self.cache_bytes and len(self._cache) > 1:
+            cached -= len(self._cache.popitem(last=False)[1])
+        return data
+
+    def readable(self): return True
+    def seekable(self): return True
+    def tell(self): return self._pos
+
+    def seek(self, offset: int, whence: int=io.SEEK_SET):
+        if whence == io.SEEK_CUR: offset += self._pos
+        elif whence == io.SEEK_END: offset += self.size
+        self._pos = max(offset, 0)
+        return self._pos
+
+    def readinto(self, buffer):
+        view = memoryview(buffer).cast('B')
+        n = 0
+        while n < len(view) and self._pos < self.size:
+            i = bisect.bisect_right(self._starts, self._pos) - 1
+            block = self._block(i)
+            start = self._pos - self._starts[i]
+            count = min(len(view) - n, len(block) - start)
+            view[n : n+count] = block[start : start+count]
+            n += count
+            self._pos += count
+        return n
+
+    def reopen(self):
+        """own file handle and cache for a process that inherited this file through fork, the index is kept"""
+        self._file = open(self.name, 'rb')
+        self._cache = collections.OrderedDict()
+        self._pos = 0
+
+    def close(self):
+        self._file.close()
+        self._cache.clear()
+        super().close()
+
+
+
+class GzipFile(BlockFile):
+    def __init__(self, path: str, span: int=SPAN, cache_bytes: int=CACHE_BYTES):
+        super().__init__(path, cache_bytes)
+        self._span = span
+        self._checkpoints = [] # (decompressor, pending input, file offset of the next input)
+        self._build_index()
+
+    def _inflate(self, d, pending: bytes, offset: int):
+        """decompressed chunks from a decompressor state onwards, also across gzip members"""
+        self._file.seek(offset)
+        while True:
+            if not pending: pending = self._file.read(_CHUNK)
+            out = d.decompress(pending, _CHUNK)
+            if not pending and not out: return
+            pending = d.unconsumed_tail
+            if d.eof:
+                pending = d.unused_data
+                d = zlib.decompressobj(zlib.MAX_WBITS | 16)
+            if out: yield out
+
+    def _build_index(self):
+        d = zlib.decompressobj(zlib.MAX_WBITS | 16)
+        self._checkpoints.append((d.copy(), b'', 0))
+
+        pos = 0
+        pending = b''
+        while True:
+            if not pending: pending = self._file.read(_CHUNK)
+
+            # stop exactly on the block boundaries to take the checkpoints there
+            boundary = len(self._checkpoints) * self._span
+            out = d.decompress(pending, boundary - pos)
+            if not pending and not out: break
+            pending = d.unconsumed_tail
+            if d.eof:
+                pending = d.unused_data
+                d = zlib.decompressobj(zlib.MAX_WBITS | 16)
+            pos += len(out)
+
+            if pos == boundary:
+                self._checkpoints.append((d.copy(), pending, self._file.tell()))
+
+        blocks = (pos + self._span - 1) // self._span
+        self._checkpoints = self._checkpoints[:blocks]
+        self._starts = [i * self._span for i in range(blocks)]
+        self._sizes = [min(self._span, pos - _) for _ in self._starts]
+
+    def _load(self, i: int) -> bytes:
+        d, pending, offset = self._checkpoints[i]
+        data = bytearray()
+        for out in self._inflate(d.copy(), pending, offset):
+            data += out
+            if len(data) >= self._sizes[i]: break
+        return bytes(data[:self._sizes[i]])
+
+
+
+class ZstdSeekableFile(BlockFile):
+    def __init__(self, path: str, cache_bytes: int=CACHE_BYTES):
+        super().__init__(path, cache_bytes)
+        try:
+            import zstandard
+        except ImportError:
+            raise ImportError('reading zstd compressed minidumps needs the zstandard package')
+        self._decompressor = zstandard.ZstdDecompressor()
+        self._offsets = [] # compressed offset and size of every frame
+        self._read_seek_table()
+
+    def _read_seek_table(self):
+        self._file.seek(-9, io.SEEK_END)
+        frames, descriptor, magic = struct.unpack('<IBI', self._file.read(9))
+        if magic != ZSTD_SEEKABLE_MAGIC:
+            raise ValueError('{0} is not in the zstd seekable format'.format(self.name))
+
+        entry_size = 12 if descriptor & 0x80 else 8
+        self._file.seek(-(9 + frames * entry_size), io.SEEK_END)
+        table = self._file.read(frames * entry_size)
+
+        compressed, uncompressed = 0, 0
+        for i in range(frames):
+            csize, usize = struct.unpack_from('<II', table, i * entry_size)
+            self._offsets.append((compressed, csize))
+            self._starts.append(uncompressed)
+            self._sizes.append(usize)
+            compressed += csize
+            uncompressed += usize
+
+    def _load(self, i: int) -> bytes:
+        offset, size = self._offsets[i]
+        self._file.seek(offset)
+        return self._decompressor.decompress(self._file.read(size), max_output_size=self._sizes[i])
+
+
+
+def open_compressed(path: str, cache_bytes: int=CACHE_BYTES):
+    """seekable file object of the decompressed contents, None if the file is not compressed"""
+    with open(path, 'rb') as f:
+        magic = f.read(4)
+    if magic.startswith(GZIP_MAGIC): return GzipFile(path, cache_bytes=cache_bytes)
+    if magic == ZSTD_MAGIC or struct.unpack('<I', magic.ljust(4, b'\0'))[0] == ZSTD_SKIPPABLE_MAGIC:
+        return ZstdSeekableFile(path, cache_bytes=cache_bytes)
+    return None
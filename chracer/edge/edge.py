@@ -1,6 +1,8 @@
+import functools
 from enum import Enum
 from minidump.minidumpfile import MinidumpFile
 
+from chracer.chromium import has_navigation as _has_navigation
 from chracer.interface import ChromiumInstanceInterface, Field
 from chracer.tab import *
 from chracer.std import *
@@ -62,6 +64,7 @@ class EdgeBrowserCreateParams(ChromiumInstanceInterface):
 
 class EdgeBrowser(ChromiumInstanceInterface):
     _INSTANCE_SIZE = 1112
+    _SNAPSHOT = True
     
     class Type(Enum):
         TYPE_NORMAL = 0
@@ -322,4 +325,8 @@ class EdgeFrameNavigationEntry(ChromiumInstanceInterface):
         return GURL(self._mdmp, self._url.va)
     @property
     def method(self):
-        return U8String(self._mdmp, self._method.va)
\ No newline at end of file
+        return U8String(self._mdmp, self._method.va)
+
+
+
+has_navigation = functools.partial(_has_navigation, tab_cls=EdgeTab, entry_cls=EdgeNavigationEntry)
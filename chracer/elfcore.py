@@ -0,0 +1,126 @@
+import struct
+import types
+from minidump.streams import MemoryType, MemoryState, AllocationProtect
+
+# Linux ELF core files (x86-64, little endian) read through the same interface
+# as minidump.minidumpfile.MinidumpFile: PT_LOAD segments become the captured
+# memory segments, and together with the NT_FILE note the memory regions with
+# the Windows type/state/protection values the validators expect.
+
+ELF_MAGIC = b'\x7fELF'
+ET_CORE = 4
+PT_LOAD = 1
+PT_NOTE = 4
+NT_FILE = 0x46494C45
+PF_X, PF_W, PF_R = 1, 2, 4
+
+_PROTECTIONS = {
+    0: AllocationProtect.PAGE_NOACCESS,
+    PF_R: AllocationProtect.PAGE_READONLY,
+    PF_R | PF_W: AllocationProtect.PAGE_READWRITE,
+    PF_X: AllocationProtect.PAGE_EXECUTE,
+    PF_R | PF_X: AllocationProtect.PAGE_EXECUTE_READ,
+    PF_R | PF_W | PF_X: AllocationProtect.PAGE_EXECUTE_READWRITE,
+}
+
+
+
+class ElfSegment:
+    # same attributes as minidump's MinidumpMemorySegment
+    def __init__(self, start_virtual_address: int, size: int, start_file_address: int):
+        self.start_virtual_address = start_virtual_address
+        self.size = size
+        self.end_virtual_address = start_virtual_address + size
+        self.start_file_address = start_file_address
+
+class ElfRegion:
+    # same attributes as minidump's MemoryInfo
+    def __init__(self, base: int, size: int, protect: AllocationProtect, type: MemoryType):
+        self.BaseAddress = base
+        self.AllocationBase = base
+        self.AllocationProtect = protect
+        self.RegionSize = size
+        self.State = MemoryState.MEM_COMMIT
+        self.Protect = protect
+        self.Type = type
+
+
+
+class ElfCoreFile:
+    def __init__(self):
+        self.filename = None
+        self.file_handle = None
+        self.directories = []
+        self.modules = types.SimpleNamespace(modules=[])
+        self.memory_segments = None
+        self.memory_segments_64 = None
+        self.memory_info = None
+        self.mapped_files = [] # (start, end, file offset, path) from NT_FILE
+
+    @staticmethod
+    def parse(filename: str):
+        ef = ElfCoreFile()
+        ef.filename = filename
+        ef.file_handle = open(filename, 'rb')
+        ef._parse()
+        return ef
+
+    def _parse(self):
+        f = self.file_handle
+        f.seek(0)
+        ident = f.read(64)
+        if ident[:4] != ELF_MAGIC or ident[4] != 2 or ident[5] != 1:
+            raise ValueError('{0} is not a 64-bit little endian ELF file'.format(self.filename))
+
+        e_type, = struct.unpack_from('<H', ident, 16)
+        if e_type != ET_CORE: raise ValueError('{0} is not an ELF core file'.format(self.filename))
+        e_phoff, = struct.unpack_from('<Q', ident, 32)
+        e_phentsize, e_phnum = struct.unpack_from('<HH', ident, 54)
+
+        f.seek(e_phoff)
+        table = f.read(e_phentsize * e_phnum)
+        loads = []
+        for i in range(e_phnum):
+            p_type, p_flags, p_offset, p_vaddr, p_paddr, p_filesz, p_memsz, p_align = \
+                struct.unpack_from('<IIQQQQQQ', table, i * e_phentsize)
+            if p_type == PT_LOAD: loads.append((p_vaddr, p_memsz, p_offset, p_filesz, p_flags))
+            elif p_type == PT_NOTE: self._parse_notes(p_offset, p_filesz)
+
+        # files with an executable mapping are loaded images, other file mappings are MEM_MAPPED
+        images = set(name for start, end, offset, name in self.mapped_files
+            if any(start <= _[0] < end and _[4] & PF_X for _ in loads))
+
+        segments = []
+        infos = []
+        for vaddr, memsz, offset, filesz, flags in loads:
+            if filesz: segments.append(ElfSegment(vaddr, min(filesz, memsz), offset))
+
+            memory_type = MemoryType.MEM_PRIVATE
+            for start, end, file_offset, name in self.mapped_files:
+                if start <= vaddr < end:
+                    memory_type = MemoryType.MEM_IMAGE if name in images else MemoryType.MEM_MAPPED
+                    break
+            infos.append(ElfRegion(vaddr, memsz, _PROTECTIONS.get(flags & 7, AllocationProtect.PAGE_NOACCESS), memory_type))
+
+        self.memory_segments_64 = types.SimpleNamespace(memory_segments=segments)
+        self.memory_info = types.SimpleNamespace(infos=infos)
+
+    def _parse_notes(self, offset: int, size: int):
+        self.file_handle.seek(offset)
+        data = self.file_handle.read(size)
+
+        pos = 0
+        while pos + 12 <= len(data):
+            namesz, descsz, note_type = struct.unpack_from('<III', data, pos)
+            pos += 12 + ((namesz + 3) & ~3)
+            desc = data[pos : pos+descsz]
+            pos += (descsz + 3) & ~3
+            if note_type == NT_FILE: self._parse_nt_file(desc)
+
+    def _parse_nt_file(self, desc: bytes):
+        count, page_size = struct.unpack_from('<QQ', desc, 0)
+        names = desc[16 + count*24:].split(b'\x00')
+        for i in range(count):
+            start, end, page = struct.unpack_from('<QQQ', desc, 16 + i*24)
+            name = names[i].decode('utf-8', 'replace') if i < len(names) else ''
+            self.mapped_files.append((start, end, page * page_size, name))
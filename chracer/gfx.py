@@ -13,9 +13,9 @@ class Point(ChromiumInstanceInterface):
 
     def __getattr__(self, name):
         if name == 'x':
-            return convert_int(self._read_field(self._x), signed=True)
+            return self._value(self._x, signed=True)
         if name == 'y':
-            return convert_int(self._read_field(self._y), signed=True)
+            return self._value(self._y, signed=True)
 
     def validate(self, debug=False):
         return False if self.x < 0 or self.y < 0 else True
@@ -34,9 +34,9 @@ class Size(ChromiumInstanceInterface):
 
     def __getattr__(self, name):
         if name == 'width':
-            return convert_int(self._read_field(self._width), signed=True)
+            return self._value(self._width, signed=True)
         if name == 'height':
-            return convert_int(self._read_field(self._height), signed=True)
+            return self._value(self._height, signed=True)
     
     def validate(self, debug=False):
         return False if self.width < 0 or self.height < 0 else True
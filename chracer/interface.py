@@ -1,9 +1,14 @@
+import struct
+import warnings
 from minidump.minidumpfile import MinidumpFile
 
 from chracer import ChromiumSymbols
+from chracer.reader import get_reader
 from chracer.common_lib import *
 
 class Field:
+    __slots__ = ('_base', '_offset', '_size', '_name')
+
     def __init__(self, base: int, offset: int, size: int, name: str):
         self._base = base
         self._offset = offset
@@ -23,44 +28,236 @@ class Field:
 
 
 
+class LayoutField:
+    # shared by every instance of a class, bound to the instance's base on access
+    __slots__ = ('offset', 'size', 'name', 'datatype')
+
+    def __init__(self, offset: int, size: int, name: str, datatype: str):
+        self.offset = offset
+        self.size = size
+        self.name = name
+        self.datatype = datatype
+
+    def __get__(self, instance, owner):
+        if instance is None: return self
+        return Field(instance._base, self.offset, self.size, self.name)
+
+
+
+class Layout:
+    _SCALAR_FORMATS = {1: 'B', 2: 'H', 4: 'I', 8: 'Q'}
+    _FLOAT_FORMATS = {('float', 4): 'f', ('double', 8): 'd'}
+
+    def __init__(self, path: str, size: int, fields: tuple):
+        self.path = path
+        self.size = size
+        self.fields = fields
+
+        # every non-overlapping scalar member decoded by a single unpack
+        fmt = '<'
+        end = 0
+        self.scalars = {}
+        for f in sorted(fields, key=lambda f: f.offset):
+            code = self._FLOAT_FORMATS.get((f.datatype, f.size), self._SCALAR_FORMATS.get(f.size))
+            if not code or f.offset < end or f.name in self.scalars: continue
+
+            if f.offset > end: fmt += '{}x'.format(f.offset - end)
+            fmt += code
+            end = f.offset + f.size
+            self.scalars[f.name] = (len(self.scalars), f.offset)
+        self.struct = struct.Struct(fmt)
+
+    @staticmethod
+    def compile(path: str):
+        sym = ChromiumSymbols.find(path)
+        fields = []
+        for mem in sym.findall('member[@kind="Member"]'):
+            field_name = '_' + mem.attrib.get('name')
+            if field_name[-1] == '_': field_name = field_name[:-1]
+
+            field_offset = int(mem.attrib.get('offset'), base=16)
+
+            field_size = int(mem.attrib.get('length'), base=16)
+            if field_size == 0: field_size = get_type_size(mem.attrib.get('datatype'))
+
+            fields.append(LayoutField(field_offset, field_size, field_name, mem.attrib.get('datatype')))
+        return Layout(path, int(sym.attrib.get('length', '0'), base=16), tuple(fields))
+
+
+
+# validate() may be declared as _CHECKS, (cost, name, predicate) stages that
+# run_checks() runs cheapest first (source order between equal costs),
+# stopping at the first predicate that fails or raises. A predicate takes the
+# object and the debug flag, which it passes on to the validate() of member
+# objects. How many candidates every stage saw and rejected is counted per
+# class.
+COST_SCALAR = 1     # a member compared to constants
+COST_POINTER = 2    # a pointer looked up in the memory regions
+COST_READ = 5       # a member object read and checked (string, rect)
+COST_NESTED = 20    # validate() of an object behind a pointer
+
+
+
 class ChromiumInstanceInterface:
     _INSTANCE_SIZE = 0
     _INSTANCE_LAYOUT = ''
+    _LAYOUT = None
+    # read _INSTANCE_SIZE bytes once and serve the fields of the object from them
+    _SNAPSHOT = False
+    # (cost, name, predicate(obj, debug)) stages of validate(), see run_checks()
+    _CHECKS = ()
 
     def __init__(self, mdmp: MinidumpFile, va: int):
         self._mdmp = mdmp
+        # _ci_ prefix: never the name of a PDB member (members are installed as _<name>)
+        self._ci_reader = get_reader(mdmp)
         self._base = va
+        self._ci_values = None
+        self._ci_buffer = None
     
     @property
     def base(self): return self._base
     @classmethod
     def instance_size(self): return self._INSTANCE_SIZE
 
+    def _snapshot(self):
+        if self._ci_buffer is None:
+            try:
+                self._ci_buffer = self._ci_reader.read(self.base, self._INSTANCE_SIZE)
+            except Exception:
+                self._ci_buffer = b'' # e.g. the object crosses the end of a segment, read fields one by one
+        return self._ci_buffer
+
+    def refresh(self):
+        """drop the snapshot and the decoded values, the next access reads the dump again"""
+        self._ci_buffer = None
+        self._ci_values = None
+
     def _read(self, size: int):
-        return self._mdmp.get_reader().read(self.base, size)
+        return self._read_at(0, size)
     
     def _read_field(self, field: Field):
-        return self._mdmp.get_reader().read(field.va, field.size)
+        if field.base == self.base: return self._read_at(field.offset, field.size)
+        return self._ci_reader.read(field.va, field.size)
     
     def _read_at(self, offset: int, size: int):
-        return self._mdmp.get_reader().read(self.base + offset, size)
+        if 0 <= offset and offset + size <= self._INSTANCE_SIZE:
+            buffer = self._snapshot() if self._SNAPSHOT else self._ci_buffer # primed by prime()
+            if buffer: return buffer[offset : offset+size]
+        return self._ci_reader.read(self.base + offset, size)
     
     def _read_from(self, va: int, size: int=0):
-        return self._mdmp.get_reader().read(va, size if size > 0 else self._INSTANCE_SIZE)
+        return self._ci_reader.read(va, size if size > 0 else self._INSTANCE_SIZE)
     
+    @classmethod
+    def _install_layout(cls, layout: Layout):
+        if cls.__dict__.get('_LAYOUT'):
+            for f in cls.__dict__['_LAYOUT'].fields:
+                if cls.__dict__.get(f.name) is f: delattr(cls, f.name)
+
+        for f in layout.fields:
+            # never hide methods or attributes the class already defines
+            if not isinstance(getattr(cls, f.name, f), LayoutField):
+                warnings.warn('{0}: member {1} of {2} collides with {0}.{1} and is only reachable through {0}._LAYOUT'.format(
+                    cls.__name__, f.name, layout.path), stacklevel=3)
+                continue
+            setattr(cls, f.name, f)
+        cls._LAYOUT = layout
+
     def _load_symbols(self, path: str):
-        sym = ChromiumSymbols.find(path)
-        members = sym.findall('member[@kind="Member"]')
-        for mem in members:
-            field_name = '_' + mem.attrib.get('name')
-            if field_name[-1] == '_': field_name = field_name[:-1]
+        layout = ChromiumSymbols._layouts.get(path)
+        if layout is None:
+            layout = ChromiumSymbols._layouts[path] = Layout.compile(path)
 
-            field_offset = int(mem.attrib.get('offset'), base=16)
-            
-            field_size = int(mem.attrib.get('length'), base=16)
-            if field_size == 0: field_size = get_type_size(mem.attrib.get('datatype'))
-            
-            self.__setattr__(field_name, Field(self.base, field_offset, field_size, field_name))
+        cls = type(self)
+        if cls.__dict__.get('_LAYOUT') is not layout: cls._install_layout(layout)
+
+    def _unpack(self):
+        if self._ci_values is None:
+            layout = type(self)._LAYOUT
+            try:
+                self._ci_values = layout.struct.unpack_from(self._read(layout.struct.size))
+            except Exception:
+                self._ci_values = tuple() # fall back to reading fields one by one
+        return self._ci_values
+
+    def _value(self, field: Field, signed=False):
+        layout = type(self)._LAYOUT
+        _ = layout.scalars.get(field.name) if layout else None
+        if _ and _[1] == field.offset and field.base == self.base:
+            values = self._unpack()
+            if values:
+                v = values[_[0]]
+                if signed and isinstance(v, int) and v >= 1 << (field.size*8 - 1): v -= 1 << (field.size*8)
+                return v
+        return convert_int(self._read_field(field), signed=signed)
+
+    @classmethod
+    def _stages(cls):
+        if '_STAGES' not in cls.__dict__:
+            cls._STAGES = tuple(sorted(cls._CHECKS, key=lambda _: _[0]))
+            cls._STATS = {name: [0, 0] for cost, name, check in cls._STAGES}
+        return cls._STAGES
+
+    @classmethod
+    def rejection_stats(cls):
+        """(name, candidates checked, rejected) of every stage, in the order they run"""
+        return [(name, ) + tuple(cls._STATS[name]) for cost, name, check in cls._stages()]
+
+    @classmethod
+    def merge_stats(cls, stats: list):
+        """add rejection_stats() of another process (e.g. a scan worker)"""
+        cls._stages()
+        for name, checked, rejected in stats:
+            if name in cls._STATS:
+                cls._STATS[name][0] += checked
+                cls._STATS[name][1] += rejected
+
+    def run_checks(self, debug=False) -> bool:
+        cls = type(self)
+        for cost, name, check in cls._stages():
+            counts = cls._STATS[name]
+            counts[0] += 1
+            try:
+                ok, error = check(self, debug), ''
+            except Exception as e:
+                ok, error = False, ' ({0})'.format(e)
+            if not ok:
+                counts[1] += 1
+                if debug: print('{0} -> 0x{1:X} INVALID {2}{3}'.format(cls.__name__, self.base, name, error))
+                return False
+        return True
 
     def validate(self, debug=False):
-        return True
\ No newline at end of file
+        return self.run_checks(debug)
+
+
+
+def prime(objects: list):
+    """read the snapshots of many objects with one batched read, returns the objects"""
+    by_reader = {}
+    for o in objects:
+        if o is None or o._ci_buffer is not None or o._INSTANCE_SIZE <= 0: continue
+        by_reader.setdefault(id(o._ci_reader), []).append(o)
+
+    for group in by_reader.values():
+        buffers = group[0]._ci_reader.read_many([(o.base, o._INSTANCE_SIZE) for o in group])
+        for o, buffer in zip(group, buffers):
+            o._ci_buffer = buffer if buffer is not None else b''
+    return objects
+
+def probe(mdmp: MinidumpFile, cls):
+    """an instance of cls at address 0, which installs its layout, None when __init__ cannot run there (e.g. it reads the object)"""
+    try:
+        return cls(mdmp, 0)
+    except Exception:
+        return None
+
+def field_of(mdmp: MinidumpFile, cls, name: str):
+    """the Field or LayoutField `name` of cls (offset and size), otherwise None
+
+    Without a probe instance only the members of an installed layout are known.
+    """
+    instance = probe(mdmp, cls)
+    f = getattr(cls if instance is None else instance, name, None)
+    return f if isinstance(f, (Field, LayoutField)) else None
@@ -0,0 +1,80 @@
+import concurrent.futures
+from minidump.minidumpfile import MinidumpFile
+
+from chracer import ChromiumSymbols
+from chracer.symcache import SymbolCache
+from chracer.prune import referenced_paths
+from chracer.reader import drop_reader
+from chracer.compressed import open_compressed, BlockFile
+from chracer.elfcore import ElfCoreFile, ELF_MAGIC
+
+# Loading the symbols and parsing the minidump do not depend on each other, so
+# load_dump() does both at once. Stale symbol caches are compiled in a child
+# process (the result is the cache file on disk); opening them and compiling
+# the layouts of every class Chracer reads happens on a background thread.
+#
+# Scan workers attach to the caches the parent already compiled: forked
+# workers inherit the compiled layouts and reopen their own read-only
+# connections, spawned ones pass worker_initializer() to the pool.
+
+
+
+def _compile_cache(xml_path: str):
+    cache = SymbolCache(xml_path)
+    if not cache.is_fresh(): cache.compile()
+
+def preload_symbols(paths: list=None, processes: bool=True):
+    """open the symbol caches and compile the layouts of the given symbol paths (default: all used by chracer)"""
+    from chracer.interface import Layout
+
+    stale = []
+    for sym in ChromiumSymbols._sym_files:
+        try:
+            if not sym.is_fresh(): stale.append(sym.xml_path)
+        except OSError:
+            pass # missing XML, lookups will tell
+
+    if stale and processes:
+        try:
+            with concurrent.futures.ProcessPoolExecutor(max_workers=len(stale)) as pool:
+                list(pool.map(_compile_cache, stale))
+        except Exception:
+            pass # SymbolCache.open() compiles in-process or falls back to scanning the XML
+
+    for sym in ChromiumSymbols._sym_files: sym.open()
+
+    for path in paths if paths is not None else referenced_paths():
+        if path in ChromiumSymbols._layouts or ChromiumSymbols.find(path) is None: continue
+        ChromiumSymbols._layouts[path] = Layout.compile(path)
+
+def worker_initializer(xml_paths: list=None):
+    """pool initializer for workers that do not inherit the parent's state (spawn/forkserver)"""
+    if xml_paths: ChromiumSymbols.use(xml_paths)
+    preload_symbols(processes=False)
+
+def open_dump(path: str):
+    """parse a minidump or an ELF core file, reading gzip and zstd (seekable) compressed minidumps in place"""
+    with open(path, 'rb') as f:
+        if f.read(4) == ELF_MAGIC: return ElfCoreFile.parse(path)
+
+    f = open_compressed(path)
+    if f is None: return MinidumpFile.parse(path)
+    return MinidumpFile.parse_external(f, path)
+
+def reopen_dump(mdmp):
+    """give a dump inherited through fork its own file handle, keeping what was parsed (e.g. the gzip index)"""
+    if isinstance(mdmp.file_handle, BlockFile): mdmp.file_handle.reopen()
+    else: mdmp.file_handle = open(mdmp.filename, 'rb')
+    drop_reader(mdmp)
+    return mdmp
+
+def load_dump(path: str, select: bool=True):
+    """parse the minidump while the symbols load; returns (minidump, modules whose symbol pack was selected)"""
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as pool:
+        symbols = pool.submit(preload_symbols)
+        mdmp = open_dump(path)
+        symbols.result()
+
+    modules = ChromiumSymbols.select(mdmp) if select else []
+    if modules: preload_symbols()
+    return mdmp, modules
@@ -0,0 +1,79 @@
+import weakref
+import numpy as np
+from minidump.minidumpfile import MinidumpFile
+
+from chracer.reader import get_reader
+from chracer.interface import field_of
+from chracer.validator import get_regions, validate_pointers
+
+# Objects are usually reachable only from their owner, so the way back from
+# an object (e.g. found by carving a string) to its owner is the pointer that
+# refers to it. PointerIndex reads the private read/write memory of a dump
+# once and keeps every aligned qword that points to captured memory, sorted
+# by its value next to the address holding it, so "who points at X" is a
+# binary search.
+
+SLICE_BYTES = 16 << 20
+
+_indexes = weakref.WeakKeyDictionary()
+
+
+
+class PointerIndex:
+    def __init__(self, mdmp: MinidumpFile):
+        self._mdmp = mdmp
+        values, locations = [], []
+
+        regions = get_regions(mdmp)
+        reader = get_reader(mdmp)
+        for i, base in enumerate(regions.bases):
+            if not regions.is_rw_private(base): continue
+            end = base + (regions.ends[i] - base) // 8 * 8
+            for start in range(base, end, SLICE_BYTES):
+                size = min(SLICE_BYTES, end - start)
+                try:
+                    q = np.frombuffer(reader.read(start, size), dtype='<u8')
+                except Exception:
+                    continue # not captured in one piece
+                hits = np.nonzero(validate_pointers(mdmp, q, False))[0]
+                values.append(q[hits].astype(np.uint64))
+                locations.append(np.uint64(start) + hits.astype(np.uint64) * 8)
+
+        values = np.concatenate(values) if values else np.zeros(0, dtype=np.uint64)
+        locations = np.concatenate(locations) if locations else np.zeros(0, dtype=np.uint64)
+        order = np.argsort(values, kind='stable') # locations stay in address order per value
+        self.values = values[order]
+        self.locations = locations[order]
+
+    def __len__(self):
+        return len(self.values)
+
+    def who_points_at(self, va: int) -> np.ndarray:
+        """addresses of the qwords holding va"""
+        lo = np.searchsorted(self.values, np.uint64(va), side='left')
+        hi = np.searchsorted(self.values, np.uint64(va), side='right')
+        return self.locations[lo:hi]
+
+    def who_points_into(self, va: int, size: int) -> tuple:
+        """(pointer values, addresses holding them) of the pointers into [va, va+size)"""
+        lo = np.searchsorted(self.values, np.uint64(va), side='left')
+        hi = np.searchsorted(self.values, np.uint64(va + size), side='left')
+        return self.values[lo:hi], self.locations[lo:hi]
+
+    def owners(self, va: int, cls, field: str) -> list:
+        """objects of cls whose `field` points at va and which validate()"""
+        f = field_of(self._mdmp, cls, field)
+        if f is None: raise AttributeError('{0} has no field {1}'.format(cls.__name__, field))
+        offset = f.offset
+        ret = []
+        for location in self.who_points_at(va).tolist():
+            if location < offset: continue
+            obj = cls(self._mdmp, location - offset)
+            if obj.validate(): ret.append(obj)
+        return ret
+
+def get_pointer_index(mdmp: MinidumpFile) -> PointerIndex:
+    """the PointerIndex of a dump, built on the first call"""
+    index = _indexes.get(mdmp)
+    if index is None: index = _indexes[mdmp] = PointerIndex(mdmp)
+    return index
@@ -16,33 +16,33 @@ class Profile(ChromiumInstanceInterface):
         if name == 'path':
             return U16String(self._mdmp, self._path.va)
         if name == 'path_creation_time':
-            return Time(convert_int(self._read_field(self._path_creation_time)))
+            return Time(self._value(self._path_creation_time))
         if name == 'io_task_runner':
-            return convert_int(self._read_field(self._io_task_runner))
+            return self._value(self._io_task_runner)
         if name == 'schema_registry_service':
-            return convert_int(self._read_field(self._schema_registry_service))
+            return self._value(self._schema_registry_service)
         if name == 'user_cloud_policy_manager':
-            return convert_int(self._read_field(self._user_cloud_policy_manager))
+            return self._value(self._user_cloud_policy_manager)
         if name == 'profile_policy_connector':
-            return convert_int(self._read_field(self._profile_policy_connector))
+            return self._value(self._profile_policy_connector)
         if name == 'pref_registry':
-            return convert_int(self._read_field(self._pref_registry)) 
+            return self._value(self._pref_registry) 
         if name == 'prefs':
-            return convert_int(self._read_field(self._prefs))
+            return self._value(self._prefs)
         if name == 'dummy_otr_prefs':
-            return convert_int(self._read_field(self._dummy_otr_prefs))
+            return self._value(self._dummy_otr_prefs)
         if name == 'extension_special_storage_policy':
-            return convert_int(self._read_field(self._extension_special_storage_policy))
+            return self._value(self._extension_special_storage_policy)
         if name == 'otr_profiles':
-            return convert_int(self._read_field(self._otr_profiles))
+            return self._value(self._otr_profiles)
         if name == 'start_time':
-            return Time(convert_int(self._read_field(self._start_time)))
+            return Time(self._value(self._start_time))
         if name == 'key':
-            return convert_int(self._read_field(self._key))
+            return self._value(self._key)
         if name == 'media_device_id_salt':
-            return convert_int(self._read_field(self._media_device_id_salt))
+            return self._value(self._media_device_id_salt)
         if name == 'delegate':
-            return convert_int(self._read_field(self._delegate))
+            return self._value(self._delegate)
     
     def validate(self, debug=False):
         try:
@@ -72,25 +72,25 @@ class OffTheRecordProfile(ChromiumInstanceInterface):
     
     def __getattr__(self, name):
         if name == 'profile':
-            return convert_int(self._read_field(self._profile))
+            return self._value(self._profile)
         if name == 'profile_keep_alive':
-            return convert_int(self._read_field(self._profile_keep_alive))
+            return self._value(self._profile_keep_alive)
         if name == 'otr_profile_id':
             return U8String(self._mdmp, self._otr_profile_id.va)
         if name == 'prefs':
-            return convert_int(self._read_field(self._prefs))
+            return self._value(self._prefs)
         if name == 'track_zoom_subscription':
-            return convert_int(self._read_field(self._track_zoom_subscription))
+            return self._value(self._track_zoom_subscription)
         if name == 'parent_default_zoom_level_subscription':
-            return convert_int(self._read_field(self._parent_default_zoom_level_subscription))
+            return self._value(self._parent_default_zoom_level_subscription)
         if name == 'start_time':
             return Time(self._start_time)
         if name == 'key':
-            return convert_int(self._read_field(self._key))
+            return self._value(self._key)
         if name == 'last_selected_directory':
             return U8String(self._mdmp, self._last_selected_directory.va)
         if name == 'main_frame_navigations':
-            return convert_int(self._read_field(self._main_frame_navigations))
+            return self._value(self._main_frame_navigations)
         
     def validate(self, debug=False):
         try:
@@ -0,0 +1,123 @@
+import os
+import re
+import sys
+import glob
+from xml.etree import ElementTree
+from xml.sax.saxutils import quoteattr
+
+from chracer.symcache import normalize_type, primitive_size, parse_vftable
+
+# Writes copies of the parsed PDB files that only keep the types Chracer
+# reads: every class/datatype named in a _load_symbols() path of the chracer
+# package plus everything their members embed by value (members, arrays,
+# typedefs and enums). Pointed-to types are not followed. The vftable symbols
+# of the kept classes are kept too, for the vtable-anchored scan.
+
+_NAME_PATTERN = re.compile(r'\[@name="([^"]+)"\]')
+_ARRAY_PATTERN = re.compile(r'^(.*)\[\d+\]$')
+_GROUPS = ('classes', 'datatypes', 'enums', 'typedefs')
+
+
+
+def referenced_paths(package_dir: str=os.path.dirname(__file__)):
+    """symbol paths looked up by the chracer sources, e.g. './classes/class[@name="Browser"]'"""
+    paths = set()
+    for src in glob.glob(os.path.join(package_dir, '**', '*.py'), recursive=True):
+        with open(src, encoding='utf-8') as f:
+            paths.update(re.findall(r"_load_symbols\('([^']+)'\)", f.read()))
+    return sorted(paths)
+
+def _dependency(datatype: str):
+    name = normalize_type(datatype)
+    m = _ARRAY_PATTERN.match(name)
+    if m: name = normalize_type(m.group(1))
+    if not name or primitive_size(name): return None
+    return name
+
+def _iter_types(xml_path: str):
+    """(group, element) of every type and table symbol in the file, cleared once the caller moves on"""
+    depth = 0
+    group = None
+    for event, elem in ElementTree.iterparse(xml_path, events=('start', 'end')):
+        if event == 'start':
+            depth += 1
+            if depth == 2: group = elem.tag
+            continue
+
+        depth -= 1
+        if depth == 2:
+            if group in _GROUPS: yield group, elem
+            elem.clear()
+        elif depth == 3 and group == 'tables':
+            if elem.tag == 'symbol': yield group, elem
+            elem.clear()
+        elif depth == 1:
+            elem.clear()
+
+def type_closure(xml_paths: list, roots: set):
+    deps = {}
+    for xml_path in xml_paths:
+        for group, elem in _iter_types(xml_path):
+            if group == 'tables': continue
+            _ = deps.setdefault(elem.attrib.get('name'), set())
+            if group == 'typedefs':
+                _.add(_dependency(elem.attrib.get('basetype', '')))
+            else:
+                _.update(_dependency(m.attrib.get('datatype', '')) for m in elem if m.attrib.get('kind') == 'Member')
+            _.discard(None)
+
+    closure = set()
+    pending = list(roots)
+    while pending:
+        name = pending.pop()
+        if name in closure: continue
+        closure.add(name)
+        pending.extend(deps.get(name, ()))
+    return closure
+
+def prune(xml_path: str, out_path: str, closure: set):
+    root = None
+    for event, elem in ElementTree.iterparse(xml_path, events=('start', )):
+        root = elem
+        break
+
+    groups = {}
+    for group, elem in _iter_types(xml_path):
+        name = elem.attrib.get('name')
+        if group == 'tables':
+            _ = parse_vftable(name)
+            if not _ or _[0] not in closure: continue
+        elif name not in closure: continue
+        groups.setdefault(group, []).append(ElementTree.tostring(elem, encoding='unicode').strip())
+
+    with open(out_path, 'w', encoding='utf-8') as f:
+        attrib = ''.join(' {0}={1}'.format(k, quoteattr(v)) for k, v in root.attrib.items())
+        f.write('<{0}{1}>\n'.format(root.tag, attrib))
+        for group in _GROUPS:
+            f.write('<{0}>\n'.format(group))
+            for _ in groups.get(group, []): f.write(_ + '\n')
+            f.write('</{0}>\n'.format(group))
+        f.write('<tables>\n<table name="Symbols">\n')
+        for _ in groups.get('tables', []): f.write(_ + '\n')
+        f.write('</table>\n</tables>\n')
+        f.write('</{0}>\n'.format(root.tag))
+
+
+
+if __name__ == '__main__':
+    if len(sys.argv) < 3:
+        print('Usage: python -m chracer.prune <output directory> <symbol xml> [<symbol xml> ...]')
+        exit()
+
+    out_dir, xml_paths = sys.argv[1], sys.argv[2:]
+    os.makedirs(out_dir, exist_ok=True)
+
+    roots = set(_NAME_PATTERN.search(_).group(1) for _ in referenced_paths())
+    closure = type_closure(xml_paths, roots)
+    print('{0} root types, {1} types in closure'.format(len(roots), len(closure)))
+
+    for xml_path in xml_paths:
+        out_path = os.path.join(out_dir, os.path.basename(xml_path))
+        prune(xml_path, out_path, closure)
+        print('{0} ({1} bytes) -> {2} ({3} bytes)'.format(
+            xml_path, os.path.getsize(xml_path), out_path, os.path.getsize(out_path)))
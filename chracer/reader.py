@@ -0,0 +1,174 @@
+import mmap
+import bisect
+import weakref
+import collections
+from minidump.minidumpfile import MinidumpFile
+
+from chracer.compressed import BlockFile
+
+# One reader per dump, shared by every object read from it. Dumps parsed from
+# a file on disk are memory-mapped and reads return memoryview slices of the
+# map (no copies). Compressed dumps are read straight through their BlockFile,
+# which already keeps the decompressed blocks in an LRU cache; any other file
+# handle gets an LRU cache of 4 KiB pages in front of it.
+#
+# A dump is anything shaped like minidump's MinidumpFile as far as memory goes:
+# file_handle, memory_segments_64 (or memory_segments) and memory_info. See
+# chracer.elfcore for the Linux core file source.
+
+PAGE_SIZE = 0x1000
+CACHE_BYTES = 64 << 20
+
+_readers = weakref.WeakKeyDictionary()
+
+
+
+class SegmentReader:
+    def __init__(self, mdmp: MinidumpFile):
+        segments = mdmp.memory_segments_64 if mdmp.memory_segments_64 else mdmp.memory_segments
+        segments = sorted(segments.memory_segments, key=lambda s: s.start_virtual_address)
+
+        # parallel lists so an address is resolved by one bisect
+        self._starts = [s.start_virtual_address for s in segments]
+        self._ends = [s.end_virtual_address for s in segments]
+        self._offsets = [s.start_file_address for s in segments]
+
+    @property
+    def segments(self):
+        """(start, end) of the captured memory, sorted by address"""
+        return list(zip(self._starts, self._ends))
+
+    def contains(self, va: int, size: int=1) -> bool:
+        """whether [va, va+size) was captured in the dump"""
+        i = bisect.bisect_right(self._starts, va) - 1
+        return i >= 0 and va + size <= self._ends[i]
+
+    def file_offset(self, va: int, size: int=1) -> int:
+        i = bisect.bisect_right(self._starts, va) - 1
+        if i < 0 or va >= self._ends[i]:
+            raise Exception('Address not in memory range! %s' % hex(va))
+        if va + size > self._ends[i]:
+            raise Exception('Read would cross boundaries!')
+        return self._offsets[i] + va - self._starts[i]
+
+    def read(self, va: int, size: int):
+        return self._read_file(self.file_offset(va, size), size)
+
+    def read_many(self, requests: list, gap: int=0) -> list:
+        """buffers of many (va, size) at once, None where the memory was not captured
+
+        The ranges are read in file order and ranges closer than gap bytes are
+        coalesced into one read.
+        """
+        ret = [None] * len(requests)
+        spans = []
+        for n, (va, size) in enumerate(requests):
+            if size <= 0: ret[n] = b''
+            elif self.contains(va, size): spans.append((self.file_offset(va, size), size, n))
+        spans.sort()
+
+        i = 0
+        while i < len(spans):
+            start = spans[i][0]
+            end = start + spans[i][1]
+            j = i + 1
+            while j < len(spans) and spans[j][0] <= end + gap:
+                end = max(end, spans[j][0] + spans[j][1])
+                j += 1
+
+            data = self._read_file(start, end - start)
+            for offset, size, n in spans[i:j]:
+                ret[n] = data[offset-start : offset-start+size]
+            i = j
+        return ret
+
+
+
+class MappedReader(SegmentReader):
+    def __init__(self, mdmp: MinidumpFile):
+        super().__init__(mdmp)
+        # only plain files have a descriptor, compressed dumps are not mapped
+        self._map = mmap.mmap(mdmp.file_handle.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._map)
+
+    def _read_file(self, offset: int, size: int) -> memoryview:
+        return self._view[offset : offset+size]
+
+
+
+class FileReader(SegmentReader):
+    # for file handles with a cache of their own, a second one would hold every page twice
+    def __init__(self, mdmp: MinidumpFile):
+        super().__init__(mdmp)
+        self._file = mdmp.file_handle
+
+    @property
+    def cache_bytes(self): return self._file.cache_bytes
+    @cache_bytes.setter
+    def cache_bytes(self, value: int): self._file.cache_bytes = value
+
+    def _read_file(self, offset: int, size: int) -> bytes:
+        self._file.seek(offset, 0)
+        return self._file.read(size)
+
+
+
+class CachedReader(SegmentReader):
+    def __init__(self, mdmp: MinidumpFile, cache_bytes: int=CACHE_BYTES):
+        super().__init__(mdmp)
+        self._file = mdmp.file_handle
+        self._pages = collections.OrderedDict() # file page number -> bytes
+        self.cache_bytes = cache_bytes
+        self.hits = 0
+        self.misses = 0
+
+    def _page(self, number: int) -> bytes:
+        page = self._pages.get(number)
+        if page is not None:
+            self._pages.move_to_end(number)
+            self.hits += 1
+            return page
+
+        self.misses += 1
+        self._file.seek(number * PAGE_SIZE, 0)
+        page = self._file.read(PAGE_SIZE)
+        self._pages[number] = page
+        while len(self._pages) * PAGE_SIZE > self.cache_bytes and len(self._pages) > 1:
+            self._pages.popitem(last=False)
+        return page
+
+    def _read_file(self, offset: int, size: int) -> bytes:
+        first, last = offset // PAGE_SIZE, (offset + size - 1) // PAGE_SIZE
+        start = offset - first * PAGE_SIZE
+        if first == last: return self._page(first)[start : start+size]
+
+        data = b''.join(self._page(_) for _ in range(first, last + 1))
+        return data[start : start+size]
+
+    def clear(self):
+        self._pages.clear()
+
+
+
+def drop_reader(mdmp: MinidumpFile):
+    """forget the reader of a dump, the next get_reader() builds a new one (e.g. on a new file handle)"""
+    _readers.pop(mdmp, None)
+
+def get_reader(mdmp: MinidumpFile, cache_bytes: int=None):
+    """the reader of a dump, built on the first call
+
+    cache_bytes: budget of the cache a dump that is not memory-mapped is read
+    through (the block cache of a compressed dump), the default when None
+    """
+    reader = _readers.get(mdmp)
+    if reader is None:
+        if isinstance(mdmp.file_handle, BlockFile):
+            reader = FileReader(mdmp)
+        else:
+            try:
+                reader = MappedReader(mdmp)
+            except (OSError, ValueError, TypeError, AttributeError):
+                reader = CachedReader(mdmp) # not backed by a file on disk
+        _readers[mdmp] = reader
+    if cache_bytes is not None and hasattr(reader, 'cache_bytes'): reader.cache_bytes = cache_bytes
+    return reader
@@ -0,0 +1,344 @@
+import os
+import tqdm
+import numpy as np
+import multiprocessing
+import concurrent.futures
+from minidump.minidumpfile import MinidumpFile
+
+from chracer import ChromiumSymbols
+from chracer.reader import get_reader
+from chracer.interface import Field, LayoutField, probe
+from chracer.loader import open_dump, reopen_dump, worker_initializer
+from chracer.compressed import GzipFile
+from chracer.checkpoint import ScanCheckpoint
+from chracer.symcache import parse_path
+from chracer.symstore import read_modules
+from chracer.validator import validate_pointers, get_regions
+
+# Before objects are built for every 8-byte step of a region, the cheap
+# necessary conditions of their validate() are checked for all offsets at once
+# on numpy views of the region. A class declares them in _PREFILTER:
+#
+#   'booleans':          fields holding 0 or 1
+#   'enums':             {field: upper bound (exclusive)}
+#   'nonzero':           fields that are not 0
+#   'positive':          signed fields greater than 0
+#   'pointers':          fields pointing to captured memory
+#   'nullable_pointers': the same, or null
+#
+# Polymorphic classes do not need the brute force at all: their objects start
+# with (or embed at known offsets) pointers to their vftables, module base +
+# RVA from the symbols, so exact matches of those values are the candidates.
+
+STEP = 8
+
+_UNSIGNED = {1: '<u1', 2: '<u2', 4: '<u4', 8: '<u8'}
+_SIGNED = {1: '<i1', 2: '<i2', 4: '<i4', 8: '<i8'}
+
+
+
+def object_size(mdmp: MinidumpFile, cls) -> int:
+    """bytes a candidate of cls spans: its _INSTANCE_SIZE, else the size of its layout"""
+    if cls.instance_size(): return cls.instance_size()
+    probe(mdmp, cls)
+    layout = cls._LAYOUT
+    return layout.size if layout and layout.size else STEP
+
+def _fields(mdmp: MinidumpFile, cls, spec: dict, limit: int):
+    """field name -> (offset, size) of a class, the fields it cannot tell are left out"""
+    instance = probe(mdmp, cls)
+    ret = {}
+    for key in ('booleans', 'enums', 'nonzero', 'positive', 'pointers', 'nullable_pointers'):
+        for name in spec.get(key, ()):
+            f = getattr(cls if instance is None else instance, name, None)
+            if isinstance(f, (Field, LayoutField)) and f.size in _UNSIGNED and f.offset + f.size <= limit:
+                ret[name] = (f.offset, f.size)
+    return ret
+
+def _column(data, count: int, offset: int, size: int, signed=False, stride: int=STEP):
+    """the field at `offset` of every candidate, candidates being `stride` bytes apart"""
+    dtype = (_SIGNED if signed else _UNSIGNED)[size]
+    return np.ndarray((count, ), dtype=dtype, buffer=data, offset=offset, strides=(stride, ))
+
+def _candidates(mdmp: MinidumpFile, cls, base: int, size: int, stride: int, spec: dict) -> np.ndarray:
+    inst = object_size(mdmp, cls)
+    count = len(range(0, size - inst, stride))
+    if count <= 0: return np.zeros(0, dtype=np.uint64)
+    candidates = base + np.arange(count, dtype=np.uint64) * stride
+
+    if not spec: return candidates
+    try:
+        data = get_reader(mdmp).read(base, size)
+    except Exception:
+        return candidates # not captured in one piece, leave it to validate()
+
+    fields = _fields(mdmp, cls, spec, inst)
+    column = lambda name, signed=False: _column(data, count, *fields[name], signed=signed, stride=stride)
+    mask = np.ones(count, dtype=bool)
+    for name in spec.get('booleans', ()):
+        if name in fields: mask &= column(name) <= 1
+    for name, bound in spec.get('enums', {}).items():
+        if name in fields: mask &= column(name) < bound
+    for name in spec.get('nonzero', ()):
+        if name in fields: mask &= column(name) != 0
+    for name in spec.get('positive', ()):
+        if name in fields: mask &= column(name, signed=True) > 0
+
+    # the pointer checks are lookups, only run them on what is left
+    index = np.nonzero(mask)[0]
+    for key, can_null in (('pointers', False), ('nullable_pointers', True)):
+        for name in spec.get(key, ()):
+            if name not in fields or not len(index): continue
+            values = column(name)[index]
+            index = index[validate_pointers(mdmp, values, can_null)]
+    return candidates[index]
+
+def prefilter(mdmp: MinidumpFile, cls, base: int, size: int, stride: int=STEP) -> np.ndarray:
+    """addresses in [base, base+size) where an instance of cls may start"""
+    return _candidates(mdmp, cls, base, size, stride, getattr(cls, '_PREFILTER', None))
+
+
+
+def _vptr_offsets(path: str, vftables: list):
+    """base class or None -> offset of its vftable pointer in the class"""
+    sym = ChromiumSymbols.find(path)
+    members = sym.findall('member') if sym is not None else []
+
+    ret = {}
+    for base in set(_[1] for _ in vftables):
+        if base is None or len(vftables) == 1:
+            ret[base] = 0
+            continue
+        for mem in members:
+            if base in (mem.attrib.get('datatype'), mem.attrib.get('name')):
+                ret[base] = int(mem.attrib.get('offset', '0'), base=16)
+                break
+
+    # the primary base class (offset 0) is usually not listed as a member
+    unresolved = set(_[1] for _ in vftables) - set(ret)
+    if len(unresolved) == 1: ret[unresolved.pop()] = 0
+    return ret
+
+def vtable_candidates(mdmp: MinidumpFile, cls) -> np.ndarray:
+    """addresses of private read/write memory that start an object of cls according to its vftable pointers
+
+    None when the class has no layout or no vftable of a loaded module is known.
+    """
+    probe(mdmp, cls)
+    layout = cls._LAYOUT
+    parsed = parse_path(layout.path) if layout else None
+    if not parsed: return None
+
+    vftables = ChromiumSymbols.vftables(parsed[2])
+    offsets = _vptr_offsets(layout.path, vftables)
+
+    modules = {}
+    for module in read_modules(mdmp):
+        modules[module.name.lower() + '.pdb'] = module.base
+        if module.pdb_name: modules[module.pdb_name.lower()] = module.base
+
+    anchors = {}
+    for pdb_name, base, rva in vftables:
+        if pdb_name.lower() in modules and base in offsets:
+            anchors[modules[pdb_name.lower()] + rva] = offsets[base]
+    if not anchors: return None
+
+    values = np.array(sorted(anchors), dtype=np.uint64)
+    value_offsets = np.array([anchors[_] for _ in sorted(anchors)], dtype=np.uint64)
+
+    # one pass over every private read/write region
+    regions = get_regions(mdmp)
+    reader = get_reader(mdmp)
+    ret = []
+    for i, base in enumerate(regions.bases):
+        if not regions.is_rw_private(base): continue
+        size = (regions.ends[i] - base) // STEP * STEP
+        try:
+            data = reader.read(base, size)
+        except Exception:
+            continue
+        q = np.frombuffer(data, dtype='<u8')
+        hits = np.nonzero(np.isin(q, values))[0]
+        if not len(hits): continue
+        delta = value_offsets[np.searchsorted(values, q[hits])]
+        ret.append(np.uint64(base) + hits.astype(np.uint64) * STEP - delta)
+
+    return np.unique(np.concatenate(ret)) if ret else np.zeros(0, dtype=np.uint64)
+
+
+
+
+def rw_private_regions(mdmp: MinidumpFile) -> list:
+    """(base, size) of the private read/write memory regions"""
+    regions = get_regions(mdmp)
+    return [(base, regions.ends[i] - base) for i, base in enumerate(regions.bases) if regions.is_rw_private(base)]
+
+def _validated(mdmp: MinidumpFile, cls, addresses, accept):
+    for addr in addresses:
+        obj = cls(mdmp, addr)
+        if obj.validate() and (accept is None or accept(obj)): yield obj
+
+def scan(mdmp: MinidumpFile, cls, regions: list=None, stride: int=STEP, prefilter=True, vftables: bool=True, accept=None):
+    """validated objects of cls, yielded lazily in the order of the regions and addresses
+
+    regions:   (base, size) pairs to search, the private read/write memory by default
+    stride:    distance between two candidate addresses
+    prefilter: True for the _PREFILTER of the class, False for none, or a dict in the same form
+    vftables:  take the vftable anchors of the class as the only candidates when they are
+               known, only with the default regions (the anchors come from the same memory)
+    accept:    an additional check of the validated objects
+    """
+    spec = getattr(cls, '_PREFILTER', None) if prefilter is True else (prefilter or None)
+    anchors = vtable_candidates(mdmp, cls) if vftables and regions is None else None
+    inst = object_size(mdmp, cls)
+
+    for base, size in regions if regions is not None else rw_private_regions(mdmp):
+        if anchors is not None:
+            addresses = anchors[(anchors >= base) & (anchors < base + size - inst)]
+        else:
+            addresses = _candidates(mdmp, cls, base, size, stride, spec)
+        yield from _validated(mdmp, cls, addresses.tolist(), accept)
+
+
+# The scan itself runs in a process pool. The eligible regions are cut into
+# chunks of about the same number of bytes; every chunk owns the candidates
+# starting in it and reads object size bytes past its end, so objects that
+# cross a chunk boundary are still seen whole. Forked workers inherit the
+# parsed dump (and the index of a gzip compressed one) and only open their own
+# file handle, spawned ones parse it again; either way a plain dump is memory
+# mapped and its pages are shared through the page cache. Workers validate
+# their chunks and send back addresses, which are merged in address order.
+
+CHUNK_BYTES = 16 << 20
+_MIN_CHUNK_BYTES = 256 << 10
+
+_scan_state = {}
+
+
+
+def chunk_size(mdmp: MinidumpFile, workers: int=1) -> int:
+    """bytes per chunk giving every worker about four of them, within limits"""
+    total = sum(size for base, size in rw_private_regions(mdmp))
+    return min(max(total // (workers * 4), _MIN_CHUNK_BYTES), CHUNK_BYTES)
+
+def partition(mdmp: MinidumpFile, overlap: int, workers: int=1, chunk_bytes: int=None) -> list:
+    """(base, size) chunks of the private read/write memory, `size` including `overlap` bytes past the chunk"""
+    if chunk_bytes is None: chunk_bytes = chunk_size(mdmp, workers)
+    chunk_bytes = (chunk_bytes + STEP - 1) // STEP * STEP
+
+    ret = []
+    for base, size in rw_private_regions(mdmp):
+        for start in range(base, base + size, chunk_bytes):
+            ret.append((start, min(chunk_bytes + overlap, base + size - start)))
+    return ret
+
+def _tasks(chunks: list, overlap: int, anchors, target: int) -> list:
+    """chunks grouped into tasks of about `target` bytes, with the anchored candidates of every chunk"""
+    ret = []
+    task, size = [], 0
+    for base, span in chunks:
+        candidates = None
+        if anchors is not None:
+            candidates = anchors[(anchors >= base) & (anchors < base + span - overlap)].tolist()
+        task.append((base, span, candidates))
+        size += span
+        if size >= target:
+            ret.append(task)
+            task, size = [], 0
+    if task: ret.append(task)
+    return ret
+
+def _scan_initializer(path: str, xml_paths: list, inherited: bool, cls, accept):
+    # forked workers inherit the symbols and the dump of the parent, spawned ones load them
+    if inherited:
+        _scan_state['mdmp'] = reopen_dump(_scan_state['mdmp'])
+    else:
+        worker_initializer(xml_paths)
+        _scan_state['mdmp'] = open_dump(path)
+    _scan_state['cls'] = cls
+    _scan_state['accept'] = accept
+
+def _scan_task(task: list):
+    """addresses found in the chunks of a task, and the rejection stats of validate() while scanning them"""
+    mdmp, cls, accept = _scan_state['mdmp'], _scan_state['cls'], _scan_state['accept']
+    before = cls.rejection_stats()
+    ret = []
+    for base, span, candidates in task:
+        if candidates is None: found = scan(mdmp, cls, regions=[(base, span)], accept=accept)
+        else: found = _validated(mdmp, cls, candidates, accept)
+        ret.extend(obj.base for obj in found)
+
+    stats = [(name, checked - _[1], rejected - _[2]) for (name, checked, rejected), _ in zip(cls.rejection_stats(), before)]
+    return ret, stats
+
+def parallel_scan(mdmp: MinidumpFile, cls, accept=None, workers: int=None, use_vftables: bool=True, progress: bool=False,
+        checkpoint: str=None, resume: bool=False) -> list:
+    """objects of cls found in the private read/write memory of the dump, in address order
+
+    Candidates are the vftable anchors of the class when known, the prefiltered
+    8-byte steps otherwise. A candidate is kept when validate() and
+    accept(obj) hold; cls and accept are sent to the workers, so both have to
+    be importable module level names.
+
+    With `checkpoint` (a directory) the progress is saved there while the scan
+    runs and when it is interrupted; resume=True continues the saved scan of
+    the same dump instead of starting over.
+    """
+    workers = workers or os.cpu_count() or 1
+    state = ScanCheckpoint(checkpoint, mdmp.filename, cls) if checkpoint else None
+    if state and not (resume and state.load()): state.clear() # no stale checkpoint outlives a fresh scan
+
+    anchors = vtable_candidates(mdmp, cls) if use_vftables else None
+    inst = object_size(mdmp, cls)
+    chunk_bytes = state.chunk_bytes if state and state.chunk_bytes else chunk_size(mdmp, workers)
+    chunks = partition(mdmp, inst, chunk_bytes=chunk_bytes)
+    target = state.target if state and state.target else max(sum(_[1] for _ in chunks) // (workers * 4), 1)
+    tasks = _tasks(chunks, inst, anchors, target)
+
+    results = [None] * len(tasks)
+    if state:
+        state.chunk_bytes, state.target = chunk_bytes, target
+        for i, addresses in state.done.items():
+            if i < len(tasks): results[i] = addresses
+
+    bar = tqdm.tqdm(total=len(tasks), initial=sum(_ is not None for _ in results)) if progress else None
+    def finished(i: int, addresses: list):
+        results[i] = addresses
+        if state: state.record(i, addresses)
+        if bar: bar.update()
+
+    try:
+        pending = [i for i, _ in enumerate(results) if _ is None]
+        inherited = multiprocessing.get_start_method() == 'fork'
+        # a spawned worker would decompress a whole gzip dump again to index it
+        if not inherited and isinstance(mdmp.file_handle, GzipFile): workers = 1
+
+        _scan_state.update(mdmp=mdmp, cls=cls, accept=accept)
+        if workers > 1 and len(pending) > 1:
+            xml_paths = [sym.xml_path for sym in ChromiumSymbols._sym_files]
+            pool, futures = None, {}
+            try:
+                pool = concurrent.futures.ProcessPoolExecutor(max_workers=workers, initializer=_scan_initializer,
+                    initargs=(mdmp.filename, xml_paths, inherited, cls, accept))
+                futures = {pool.submit(_scan_task, tasks[i]): i for i in pending}
+                for future in concurrent.futures.as_completed(futures):
+                    addresses, stats = future.result()
+                    cls.merge_stats(stats)
+                    finished(futures[future], addresses)
+            except (OSError, concurrent.futures.process.BrokenProcessPool):
+                pass # what is left is scanned in this process
+            finally:
+                for future in futures: future.cancel()
+                if pool: pool.shutdown()
+
+        for i, task in enumerate(tasks):
+            if results[i] is None: finished(i, _scan_task(task)[0])
+    except BaseException:
+        if state: state.save()
+        raise
+    finally:
+        if bar: bar.close()
+    if state: state.remove()
+
+    addresses = sorted(set(addr for _ in results for addr in _))
+    return [cls(mdmp, addr) for addr in addresses]
@@ -28,7 +28,7 @@ class U8String(ChromiumInstanceInterface):
             return ''
         else:
             s = self._read_from(self._string_pointer, self._string_length)
-            return s.decode('utf-8')
+            return str(s, 'utf-8')
 
     def validate(self, debug=False):
         try:
@@ -61,7 +61,7 @@ class U16String(U8String):
         if self._length_or_flag == 0: return ''
 
         s = self._read_from(self._string_pointer, self._string_length*2)
-        return s.decode('utf-16-le')
+        return str(s, 'utf-16-le')
 
 
 
@@ -108,11 +108,11 @@ class Vector(ChromiumInstanceInterface):
                 assert validate_pointer(self._mdmp, self.begin, can_null=False), "INVALID POINTER VALUE (begin)"
                 assert validate_rw_page(self._mdmp, self.begin), "INVALID POINTER VALUE (begin is not heap)"
             if self.end != 0:
-                assert validate_pointer(self._mdmp, self.end, can_null=False), "INVALID POINTER VALUE (end)"
-                assert validate_rw_page(self._mdmp, self.end), "INVALID POINTER VALUE (end is not heap)"
+                assert validate_end_pointer(self._mdmp, self.end, can_null=False), "INVALID POINTER VALUE (end)"
+                assert validate_rw_end_page(self._mdmp, self.end), "INVALID POINTER VALUE (end is not heap)"
             if self.end_cap != 0:
-                assert validate_pointer(self._mdmp, self.end_cap, can_null=False), "INVALID POINTER VALUE (end_cap)"
-                assert validate_rw_page(self._mdmp, self.end_cap), "INVALID POINTER VALUE (end_cap is not heap)"
+                assert validate_end_pointer(self._mdmp, self.end_cap, can_null=False), "INVALID POINTER VALUE (end_cap)"
+                assert validate_rw_end_page(self._mdmp, self.end_cap), "INVALID POINTER VALUE (end_cap is not heap)"
             if self.begin != 0 and self.end != 0:
                 assert self.begin < self.end, "INVALID POINTER VALUE (begin > end)"
             assert self.end <= self.end_cap, "INVALID POINTER VALUE (end > end_cap)"
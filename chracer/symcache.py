@@ -0,0 +1,394 @@
+import os
+import re
+import sys
+import json
+import sqlite3
+import hashlib
+import functools
+import urllib.request
+from xml.etree import ElementTree
+
+# Parsed PDB dumps (*.pdb.xml) are compiled once into a SQLite file next to
+# the XML. The cache remembers the SHA-256 of the XML it was built from and is
+# rebuilt only when the XML changes. Nothing is read until the first lookup,
+# and when the cache cannot be built the XML is parsed once into an in-memory
+# (kind, name) index instead; the failure is remembered until the XML changes.
+#
+# Lookups go through a read-only, memory-mapped connection, so every process
+# that opens the same cache shares its pages through the OS page cache. The
+# connection is per process and is reopened after a fork.
+
+SCHEMA_VERSION = 4
+MMAP_SIZE = 1 << 30
+
+_GROUPS = ('classes', 'datatypes', 'enums', 'typedefs')
+_PATH_PATTERN = re.compile(r'^\./(\w+)/(\w+)\[@name="(.*)"\]$')
+_ARRAY_PATTERN = re.compile(r'^(.*)\[(\d+)\]$')
+_VFTABLE_PATTERN = re.compile(r"^(.*)::`vftable'(?:\{for `(.*)'\})?$")
+_QUALIFIERS = ('const ', 'volatile ', 'struct ', 'class ', 'enum ', 'union ')
+
+POINTER_SIZE = 8
+PRIMITIVE_SIZES = {
+    'bool': 1, 'char': 1, 'signed char': 1, 'unsigned char': 1, 'uchar': 1, 'byte': 1, 'undefined': 1,
+    '__int8': 1, 'unsigned __int8': 1, 'char8_t': 1,
+    'short': 2, 'unsigned short': 2, 'ushort': 2, 'wchar_t': 2, 'char16_t': 2, 'word': 2,
+    '__int16': 2, 'unsigned __int16': 2,
+    'int': 4, 'unsigned int': 4, 'uint': 4, 'long': 4, 'unsigned long': 4, 'ulong': 4, 'dword': 4,
+    '__int32': 4, 'unsigned __int32': 4, 'char32_t': 4, 'float': 4, 'HRESULT': 4,
+    '__int64': 8, 'unsigned __int64': 8, 'long long': 8, 'unsigned long long': 8,
+    'longlong': 8, 'ulonglong': 8, 'qword': 8, 'double': 8, 'long double': 8,
+    'std::nullptr_t': 8,
+    # fixed width aliases (Ghidra, <cstdint>)
+    'int8': 1, 'uint8': 1, 'int8_t': 1, 'uint8_t': 1, 'sbyte': 1, 'undefined1': 1,
+    'int16': 2, 'uint16': 2, 'int16_t': 2, 'uint16_t': 2, 'sword': 2, 'undefined2': 2,
+    'int32': 4, 'uint32': 4, 'int32_t': 4, 'uint32_t': 4, 'sdword': 4, 'undefined4': 4,
+    'int64': 8, 'uint64': 8, 'int64_t': 8, 'uint64_t': 8, 'sqword': 8, 'undefined8': 8,
+    'size_t': 8, 'ptrdiff_t': 8, 'intptr_t': 8, 'uintptr_t': 8,
+}
+
+
+
+def file_sha256(path: str) -> str:
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+def normalize_type(name: str) -> str:
+    name = name.strip()
+    while name.startswith(_QUALIFIERS):
+        name = name.split(' ', 1)[1].strip()
+    if name.endswith(' const'): name = name[:-6].strip()
+    return name
+
+def array_type(name: str):
+    """'char[16]' -> ('char', 16), otherwise None"""
+    m = _ARRAY_PATTERN.match(normalize_type(name))
+    return (m.group(1), int(m.group(2))) if m else None
+
+def primitive_size(name: str):
+    """(size, alignment) of pointers and built-in types, otherwise None"""
+    name = normalize_type(name)
+    if name.endswith(('*', '&')): return (POINTER_SIZE, POINTER_SIZE)
+    if name in PRIMITIVE_SIZES: return (PRIMITIVE_SIZES[name], PRIMITIVE_SIZES[name])
+    return None
+
+def guess_alignment(size: int) -> int:
+    if size > 4: return 8
+    if size > 2: return 4
+    if size > 1: return 2
+    return 1
+
+def _compute_sizes(db):
+    resolved = {}
+
+    def resolve(name, seen):
+        _ = primitive_size(name)
+        if _: return _
+
+        name = normalize_type(name)
+        if name in resolved: return resolved[name]
+        if name in seen: return (0, 1)
+
+        m = _ARRAY_PATTERN.match(name)
+        if m:
+            size, align = resolve(m.group(1), seen)
+            return (size * int(m.group(2)), align)
+
+        seen.add(name)
+        ret = (0, 1)
+        rows = db.execute(
+            'SELECT kind, attrib, children FROM types WHERE kind IN (?, ?, ?, ?) AND name = ? ORDER BY rowid',
+            ('class', 'datatype', 'enum', 'typedef', name)).fetchall()
+        for kind, attrib, children in rows:
+            attrib = json.loads(attrib)
+            if kind == 'typedef':
+                ret = resolve(attrib.get('basetype', ''), seen)
+                break
+
+            size = int(attrib.get('length', '0'), base=16)
+            align = 0
+            if kind != 'enum':
+                for tag, child in json.loads(children):
+                    if child.get('kind') != 'Member': continue
+                    member_align = resolve(child.get('datatype', ''), seen)[1]
+                    if not member_align: member_align = guess_alignment(int(child.get('length', '0'), base=16))
+                    align = max(align, member_align)
+            ret = (size, min(align, 8) if align else guess_alignment(size))
+            break
+
+        seen.discard(name)
+        resolved[name] = ret
+        return ret
+
+    names = db.execute('SELECT DISTINCT name FROM types WHERE name IS NOT NULL').fetchall()
+    return [(name, ) + resolve(name, set()) for name, in names]
+
+def parse_vftable(name: str):
+    """"Browser::`vftable'{for `TabStripModelObserver'}" -> ('Browser', 'TabStripModelObserver'), otherwise None"""
+    m = _VFTABLE_PATTERN.match(name) if name else None
+    return m.groups() if m else None
+
+def _iter_vftables(elem):
+    # <tables><table name="Symbols"><symbol name="..." address="RVA" .../></table></tables>
+    if elem.tag != 'symbol': return
+    _ = parse_vftable(elem.attrib.get('name'))
+    if _ and elem.attrib.get('address'): yield _ + (int(elem.attrib.get('address'), base=16), )
+
+@functools.lru_cache(maxsize=None)
+def parse_path(path: str):
+    """'./classes/class[@name="X"]' -> ('classes', 'class', 'X'), otherwise None"""
+    m = _PATH_PATTERN.match(path)
+    return m.groups() if m else None
+
+
+
+class SymbolCache:
+    def __init__(self, xml_path: str, cache_path: str=None):
+        self._xml_path = xml_path
+        self._cache_path = cache_path if cache_path else xml_path + '.db'
+        self._db = None
+        self._pid = None
+        self._tree = None
+        self._failed = None   # (pid, XML size, XML mtime) of the last failed open()
+        self._fallback = None # (kind, name) -> elements, vftables: class -> (base, RVA)
+
+    @property
+    def xml_path(self): return self._xml_path
+    @property
+    def cache_path(self): return self._cache_path
+
+    def _source_stat(self):
+        st = os.stat(self._xml_path)
+        return st.st_size, st.st_mtime_ns
+
+    def _read_meta(self):
+        if not os.path.exists(self._cache_path): return {}
+        try:
+            db = sqlite3.connect(self._cache_path)
+            try:
+                return dict(db.execute('SELECT key, value FROM meta'))
+            finally:
+                db.close()
+        except sqlite3.DatabaseError:
+            return {}
+
+    def is_fresh(self) -> bool:
+        meta = self._read_meta()
+        if meta.get('schema') != str(SCHEMA_VERSION): return False
+
+        size, mtime = self._source_stat()
+        if meta.get('source_size') == str(size) and meta.get('source_mtime') == str(mtime):
+            return True
+
+        # touched but maybe not modified, so compare the contents
+        if meta.get('source_sha256') != file_sha256(self._xml_path): return False
+        db = sqlite3.connect(self._cache_path)
+        with db:
+            db.executemany('REPLACE INTO meta VALUES (?, ?)',
+                [('source_size', str(size)), ('source_mtime', str(mtime))])
+        db.close()
+        return True
+
+    def compile(self):
+        size, mtime = self._source_stat()
+        digest = file_sha256(self._xml_path)
+
+        tmp_path = '{}.{}.tmp'.format(self._cache_path, os.getpid())
+        if os.path.exists(tmp_path): os.remove(tmp_path)
+
+        db = sqlite3.connect(tmp_path)
+        db.execute('PRAGMA journal_mode = OFF')
+        db.execute('PRAGMA synchronous = OFF')
+        db.execute('CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT)')
+        db.execute('CREATE TABLE types (kind TEXT, name TEXT, attrib TEXT, children TEXT)')
+        db.execute('CREATE TABLE vftables (class TEXT, base TEXT, rva INTEGER)')
+
+        rows = []
+        vftables = []
+        depth = 0
+        group = None
+        for event, elem in ElementTree.iterparse(self._xml_path, events=('start', 'end')):
+            if event == 'start':
+                depth += 1
+                if depth == 2: group = elem.tag
+                continue
+
+            depth -= 1
+            if depth == 2:
+                if group in _GROUPS:
+                    children = [(c.tag, c.attrib) for c in elem]
+                    rows.append((elem.tag, elem.attrib.get('name'), json.dumps(elem.attrib), json.dumps(children)))
+                elem.clear()
+            elif depth == 3 and group == 'tables':
+                vftables.extend(_iter_vftables(elem))
+                elem.clear()
+            elif depth == 1:
+                elem.clear()
+
+            if len(rows) >= 10000:
+                db.executemany('INSERT INTO types VALUES (?, ?, ?, ?)', rows)
+                rows = []
+
+        db.executemany('INSERT INTO types VALUES (?, ?, ?, ?)', rows)
+        db.execute('CREATE INDEX types_name ON types (kind, name)')
+        db.executemany('INSERT INTO vftables VALUES (?, ?, ?)', vftables)
+        db.execute('CREATE INDEX vftables_class ON vftables (class)')
+
+        db.execute('CREATE TABLE sizes (name TEXT PRIMARY KEY, size INTEGER, align INTEGER)')
+        db.executemany('INSERT OR IGNORE INTO sizes VALUES (?, ?, ?)', _compute_sizes(db))
+        db.executemany('INSERT INTO meta VALUES (?, ?)', [
+            ('schema', str(SCHEMA_VERSION)),
+            ('source_sha256', digest),
+            ('source_size', str(size)),
+            ('source_mtime', str(mtime)),
+        ])
+        db.commit()
+        db.close()
+
+        os.replace(tmp_path, self._cache_path)
+
+    def open(self):
+        if self._db and self._pid == os.getpid(): return self
+
+        # a connection inherited through fork must not be used (or closed) by the child
+        self._db = None
+        try:
+            failed = (os.getpid(), ) + self._source_stat()
+        except OSError:
+            failed = None
+        if failed and failed == self._failed: return self # do not hash and compile again on every lookup
+
+        try:
+            if not self.is_fresh(): self.compile()
+            uri = 'file:{0}?mode=ro'.format(urllib.request.pathname2url(os.path.abspath(self._cache_path)))
+            self._db = sqlite3.connect(uri, uri=True, check_same_thread=False)
+            self._db.execute('PRAGMA mmap_size = {0}'.format(MMAP_SIZE))
+            self._pid = os.getpid()
+            self._failed = None
+        except (OSError, sqlite3.Error):
+            self._db = None
+            self._failed = failed
+        return self
+
+    def _index(self):
+        """the in-memory index used without the cache, built by one pass over the XML"""
+        if self._fallback is not None: return self._fallback
+
+        index = {}
+        vftables = {}
+        depth = 0
+        group = None
+        for event, elem in ElementTree.iterparse(self._xml_path, events=('start', 'end')):
+            if event == 'start':
+                depth += 1
+                if depth == 2: group = elem.tag
+                continue
+
+            depth -= 1
+            if depth == 2 and group in _GROUPS:
+                index.setdefault((elem.tag, elem.attrib.get('name')), []).append(elem)
+            elif depth == 3 and group == 'tables':
+                for cls, base, rva in _iter_vftables(elem): vftables.setdefault(cls, []).append((base, rva))
+                elem.clear()
+            elif depth == 2:
+                elem.clear()
+
+        self._fallback = (index, vftables)
+        return self._fallback
+
+    def _scan(self, kind: str, name: str, first: bool):
+        ret = self._index()[0].get((kind, name), [])
+        return ret[:1] if first else list(ret)
+
+    def close(self):
+        if self._db and self._pid == os.getpid(): self._db.close()
+        self._db = None
+
+    def _select(self, kind: str, name: str, first: bool=False):
+        self.open()
+        if not self._db: return self._scan(kind, name, first)
+
+        rows = self._db.execute(
+            'SELECT attrib, children FROM types WHERE kind = ? AND name = ? ORDER BY rowid', (kind, name))
+
+        ret = []
+        for attrib, children in rows:
+            e = ElementTree.Element(kind, json.loads(attrib))
+            for tag, child_attrib in json.loads(children):
+                ElementTree.SubElement(e, tag, child_attrib)
+            ret.append(e)
+        return ret
+
+    def type_size(self, name: str):
+        """(size, alignment) of a type name (qualifiers and array bounds allowed), otherwise None"""
+        _ = primitive_size(name)
+        if _: return _
+
+        name = normalize_type(name)
+        _ = array_type(name)
+        if _:
+            element = self.type_size(_[0])
+            return (element[0] * _[1], element[1]) if element else None
+
+        self.open()
+        if self._db:
+            row = self._db.execute('SELECT size, align FROM sizes WHERE name = ?', (name, )).fetchone()
+            return tuple(row) if row and row[0] else None
+
+        for kind in ('enum', 'class', 'datatype'):
+            _ = self._scan(kind, name, True)
+            if _:
+                # the alignment the sizes table computes: that of the most aligned member
+                size = int(_[0].attrib.get('length', '0'), base=16)
+                align = 0
+                for child in _[0] if kind != 'enum' else ():
+                    if child.attrib.get('kind') != 'Member' or normalize_type(child.attrib.get('datatype', '')) == name: continue
+                    member = self.type_size(child.attrib.get('datatype', ''))
+                    align = max(align, member[1] if member else guess_alignment(int(child.attrib.get('length', '0'), base=16)))
+                return (size, min(align, 8) if align else guess_alignment(size))
+        for e in self._scan('typedef', name, True):
+            basetype = e.attrib.get('basetype', '')
+            if normalize_type(basetype) != name: return self.type_size(basetype)
+        return None
+
+    def vftables(self, name: str):
+        """(base class or None, RVA) of the virtual function tables of a class"""
+        self.open()
+        if self._db:
+            return self._db.execute('SELECT base, rva FROM vftables WHERE class = ? ORDER BY rowid', (name, )).fetchall()
+
+        return list(self._index()[1].get(name, []))
+
+    def _xml(self):
+        if self._tree is None: self._tree = ElementTree.parse(self._xml_path)
+        return self._tree
+
+    def find(self, path: str):
+        parsed = parse_path(path)
+        if not parsed or parsed[0] not in _GROUPS: return self._xml().find(path)
+
+        _ = self._select(parsed[1], parsed[2], True)
+        return _[0] if _ else None
+
+    def findall(self, path: str):
+        parsed = parse_path(path)
+        if not parsed or parsed[0] not in _GROUPS: return self._xml().findall(path)
+
+        return self._select(parsed[1], parsed[2])
+
+
+
+if __name__ == '__main__':
+    if len(sys.argv) < 2:
+        print('Usage: python -m chracer.symcache <symbol xml> [<symbol xml> ...]')
+        exit()
+
+    for xml_path in sys.argv[1:]:
+        cache = SymbolCache(xml_path)
+        if cache.is_fresh():
+            print('{0} is up to date'.format(cache.cache_path))
+            continue
+        cache.compile()
+        print('{0} -> {1}'.format(xml_path, cache.cache_path))
@@ -0,0 +1,104 @@
+import io
+import os
+import ntpath
+from minidump.minidumpfile import MinidumpFile
+from minidump.constants import MINIDUMP_STREAM_TYPE
+from minidump.streams.ModuleListStream import MINIDUMP_MODULE_LIST
+
+# Symbol packs are looked up in a local store laid out like a Microsoft symbol
+# store, with the parsed XML in place of the PDB:
+#
+#   symbols/chrome.dll.pdb/<GUID><AGE>/chrome.dll.pdb.xml
+#   symbols/chrome.dll.pdb/<file version>/chrome.dll.pdb.xml   (fallback)
+
+
+
+class ModuleIdentity:
+    def __init__(self, name: str, base: int, size: int, timestamp: int, version: str,
+                 pdb_name: str=None, pdb_guid: str=None, pdb_age: int=None):
+        self.name = name
+        self.base = base
+        self.size = size
+        self.timestamp = timestamp
+        self.version = version
+        self.pdb_name = pdb_name
+        self.pdb_guid = pdb_guid
+        self.pdb_age = pdb_age
+
+    @property
+    def pdb_key(self):
+        if self.pdb_guid is None: return None
+        return '{0}{1:X}'.format(self.pdb_guid, self.pdb_age)
+
+    def __str__(self):
+        return '{0} {1} (timestamp=0x{2:08X}, pdb={3} {4})'.format(
+            self.name, self.version, self.timestamp, self.pdb_name, self.pdb_key)
+
+
+
+def _parse_codeview(data: bytes):
+    # CV_INFO_PDB70: 'RSDS', GUID, age, null-terminated PDB path
+    if len(data) < 24 or data[:4] != b'RSDS': return None, None, None
+
+    guid = '{0:08X}{1:04X}{2:04X}{3}'.format(
+        int.from_bytes(data[4:8], 'little'),
+        int.from_bytes(data[8:10], 'little'),
+        int.from_bytes(data[10:12], 'little'),
+        data[12:20].hex().upper())
+    age = int.from_bytes(data[20:24], 'little')
+    pdb_path = data[24:].split(b'\x00', 1)[0].decode('utf-8', 'replace')
+    return ntpath.basename(pdb_path), guid, age
+
+def read_modules(mdmp: MinidumpFile):
+    """identities of the loaded modules, including the PDB GUID/age of each"""
+    f = mdmp.file_handle
+    for d in mdmp.directories:
+        if d is None or d.StreamType != MINIDUMP_STREAM_TYPE.ModuleListStream: continue
+
+        pos = f.tell()
+        try:
+            f.seek(d.Location.Rva)
+            raw_modules = MINIDUMP_MODULE_LIST.parse(io.BytesIO(f.read(d.Location.DataSize))).Modules
+
+            ret = []
+            for raw, mod in zip(raw_modules, mdmp.modules.modules):
+                f.seek(raw.CvRecord.Rva)
+                pdb_name, guid, age = _parse_codeview(f.read(raw.CvRecord.DataSize))
+
+                vi = raw.VersionInfo
+                version = '{0}.{1}.{2}.{3}'.format(
+                    vi.dwFileVersionMS >> 16, vi.dwFileVersionMS & 0xFFFF,
+                    vi.dwFileVersionLS >> 16, vi.dwFileVersionLS & 0xFFFF)
+
+                ret.append(ModuleIdentity(ntpath.basename(mod.name), mod.baseaddress, mod.size,
+                    mod.timestamp, version, pdb_name, guid, age))
+            return ret
+        finally:
+            f.seek(pos)
+    return []
+
+
+
+class SymbolStore:
+    def __init__(self, root: str='symbols'):
+        self._root = root
+
+    @property
+    def root(self): return self._root
+
+    def find(self, module: ModuleIdentity):
+        """path of the parsed symbol XML matching the module, otherwise None"""
+        pdb_name = module.pdb_name if module.pdb_name else os.path.splitext(module.name)[0] + '.pdb'
+        for key in (module.pdb_key, module.version):
+            if not key: continue
+            _ = os.path.join(self._root, pdb_name, key, pdb_name + '.xml')
+            if os.path.exists(_): return _
+        return None
+
+    def select(self, mdmp: MinidumpFile):
+        """(module, symbol XML path) for every module of the dump that has a pack in the store"""
+        ret = []
+        for module in read_modules(mdmp):
+            _ = self.find(module)
+            if _: ret.append((module, _))
+        return ret
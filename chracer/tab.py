@@ -24,30 +24,30 @@ class TabStripModel(ChromiumInstanceInterface):
         if name == 'contents_data':
             return Vector(self._mdmp, self._contents_data.va, 8)
         if name == 'group_model':
-            return TabGroupModel(self._mdmp, convert_int(self._read_field(self._group_model)))
+            return TabGroupModel(self._mdmp, self._value(self._group_model))
         if name == 'delegate':
-            return convert_int(self._read_field(self._delegate))
+            return self._value(self._delegate)
         if name == 'tab_strip_ui_was_set':
-            return convert_bool(self._read_field(self._tab_strip_ui_was_set))
+            return bool(self._value(self._tab_strip_ui_was_set))
         if name == 'observers':
-            return convert_int(self._read_field(self._observers))
+            return self._value(self._observers)
         if name == 'profile':
-            return convert_int(self._read_field(self._profile))
+            return self._value(self._profile)
         if name == 'closing_all':
-            return convert_bool(self._read_field(self._closing_all))
+            return bool(self._value(self._closing_all))
         if name == 'selection_model':
             return ListSelectionMdoel(self._mdmp, self._selection_model.va)
         if name == 'reentrancy_guard':
-            return convert_bool(self._read_field(self._reentrancy_guard))
+            return bool(self._value(self._reentrancy_guard))
         
     def validate(self, debug=False):
         try:
             assert self.contents_data.validate(debug), "INVALID std::Vector"
             assert self.group_model.validate(debug), "INVALID tab_groups::TabGroupModel"
-            assert validate_boolean(convert_int(self._read_field(self._tab_strip_ui_was_set))), "INVALID bool (tab_strip_ui_was_set)"
-            assert validate_boolean(convert_int(self._read_field(self._closing_all))), "INVALID bool (closing_all)"
+            assert validate_boolean(self._value(self._tab_strip_ui_was_set)), "INVALID bool (tab_strip_ui_was_set)"
+            assert validate_boolean(self._value(self._closing_all)), "INVALID bool (closing_all)"
             assert self.selection_model.validate(debug), "INVALID ui::ListSelectionModel"
-            assert validate_boolean(convert_int(self._read_field(self._reentrancy_guard))), "INVALID bool (closing_all)"
+            assert validate_boolean(self._value(self._reentrancy_guard)), "INVALID bool (closing_all)"
         except Exception as e:
             if debug: print('TabStripModel -> 0x{0:X} {1}'.format(self.base, e))
             return False
@@ -83,7 +83,7 @@ class TabGroupId(ChromiumInstanceInterface):
 
     def __getattr__(self, name):
         if name == 'token':
-            return convert_int(self._read_field(self._token))
+            return self._value(self._token)
 
 
 
@@ -98,18 +98,18 @@ class TabGroup(ChromiumInstanceInterface):
         if name == 'id':
             return TabGroupId(self._mdmp, self._id.va)
         if name == 'visual_data':
-            return TabGroupVisualData(self._mdmp, convert_int(self._read_field(self._visual_data)))
+            return TabGroupVisualData(self._mdmp, self._value(self._visual_data))
         if name == 'tab_count':
-            return convert_int(self._read_field(self._tab_count), signed=True)
+            return self._value(self._tab_count, signed=True)
         if name == 'is_customized':
-            return convert_bool(self._read_field(self._is_customized))
+            return bool(self._value(self._is_customized))
 
     def validate(self, debug=False):
         try:
             assert self.id.validate(debug), "INVALID TabGroupId"
             assert self.visual_data.validate(debug), "INVALID TabGroupVisualData"
             assert self.tab_count < 1, "INVALID integer (tab_count)"
-            assert validate_boolean(convert_int(self._read_field(self._is_customized))), "INVALID bool"
+            assert validate_boolean(self._value(self._is_customized)), "INVALID bool"
         except Exception as e:
             if debug: print('TabGroup -> 0x{0:X} {1}'.format(self.base, e))
             return False
@@ -143,15 +143,15 @@ class TabGroupVisualData(ChromiumInstanceInterface):
         if name == 'title':
             return U16String(self._mdmp, self._title.va)
         if name == 'color':
-            return TabGroupVisualData.TabGroupColorId(convert_int(self._read_field(self._color)))
+            return TabGroupVisualData.TabGroupColorId(self._value(self._color))
         if name == 'is_collapsed':
-            return convert_bool(self._read_field(self._is_collapsed))
+            return bool(self._value(self._is_collapsed))
 
     def validate(self, debug=False):
         try:
             assert self.title.validate(debug), "INVALID std::string (title)"
             assert self.color.value < 9, 'INVALID TabGroupColorId (color)'
-            assert validate_boolean(convert_int(self._read_field(self._is_collapsed))), "INVALID bool (is_collapsed)"
+            assert validate_boolean(self._value(self._is_collapsed)), "INVALID bool (is_collapsed)"
         except Exception as e:
             if debug: print('TabGroupVisualData -> 0x{0:X} {1}'.format(self.base, e))
             return False
@@ -168,15 +168,15 @@ class Tab(ChromiumInstanceInterface):
 
     def __getattr__(self, name):
         if name == 'contents':
-            return WebContents(self._mdmp, convert_int(self._read_field(self._contents)))
+            return WebContents(self._mdmp, self._value(self._contents))
         if name == 'opener':
-            return convert_int(self._read_field(self._opener))
+            return self._value(self._opener)
         if name == 'reset_opener_on_active_tab_change':
-            return convert_bool(self._read_field(self._reset_opener_on_active_tab_change))
+            return bool(self._value(self._reset_opener_on_active_tab_change))
         if name == 'pinned':
-            return convert_bool(self._read_field(self._pinned))
+            return bool(self._value(self._pinned))
         if name == 'blocked':
-            return convert_bool(self._read_field(self._blocked))
+            return bool(self._value(self._blocked))
         if name == 'group':
             absl_opt = Optional(self._mdmp, self._base+0x18, 16)
             return convert_int(absl_opt.data) if absl_opt.engaged else 0
@@ -187,9 +187,9 @@ class Tab(ChromiumInstanceInterface):
     def validate(self, debug=False):
         try:
             assert self.contents.validate(debug), "INVALID WebContents"
-            assert validate_boolean(convert_int(self._read_field(self._reset_opener_on_active_tab_change))), "INVALID bool"
-            assert validate_boolean(convert_int(self._read_field(self._pinned))), "INVALID bool"
-            assert validate_boolean(convert_int(self._read_field(self._blocked))), "INVALID bool"
+            assert validate_boolean(self._value(self._reset_opener_on_active_tab_change)), "INVALID bool"
+            assert validate_boolean(self._value(self._pinned)), "INVALID bool"
+            assert validate_boolean(self._value(self._blocked)), "INVALID bool"
         except Exception as e:
             if debug: print('Tab -> 0x{0:X} {1}'.format(self.base, e))
             return False
@@ -227,21 +227,21 @@ class WebContents(ChromiumInstanceInterface):
     
     def __getattr__(self, name):
         if name == 'opened_by_another_window':
-            return convert_bool(self._read_field(self._opened_by_another_window))
+            return bool(self._value(self._opened_by_another_window))
         if name == 'primary_frame_tree':
             return FrameTree(self._mdmp, self._primary_frame_tree.va)
         if name == 'primary_main_frame_process_status':
-            return self.TerminationStatus(convert_int(self._read_field(self._primary_main_frame_process_status)))
+            return self.TerminationStatus(self._value(self._primary_main_frame_process_status))
         if name == 'primary_main_frame_process_error_code':
-            return convert_int(self._read_field(self._primary_main_frame_process_error_code))
+            return self._value(self._primary_main_frame_process_error_code)
         if name == 'load_state_host':
             return U16String(self._mdmp, self._load_state_host.va)
         if name == 'load_info_timestamp':
-            return TimeTicks(convert_int(self._read_field(self._load_info_timestamp)))
+            return TimeTicks(self._value(self._load_info_timestamp))
         if name == 'upload_size':
-            return convert_int(self._read_field(self._upload_size))
+            return self._value(self._upload_size)
         if name == 'upload_position':
-            return convert_int(self._read_field(self._upload_position))
+            return self._value(self._upload_position)
         if name == 'last_sent_theme_color':
             absl_opt = Optional(self._mdmp, self._last_sent_theme_color.va, 4)
             return convert_int(absl_opt.data) if absl_opt.engaged else 0
@@ -249,32 +249,32 @@ class WebContents(ChromiumInstanceInterface):
             absl_opt = Optional(self._mdmp, self._last_sent_background_color.va, 4)
             return convert_int(absl_opt.data) if absl_opt.engaged else 0
         if name == 'visibility':
-            return self.Visibility(convert_int(self._read_field(self._visibility)))
+            return self.Visibility(self._value(self._visibility))
         if name == 'maximum_zoom_percent':
-            return convert_int(self._read_field(self._maximum_zoom_percent))
+            return self._value(self._maximum_zoom_percent)
         if name == 'minimum_zoom_percent':
-            return convert_int(self._read_field(self._minimum_zoom_percent))
+            return self._value(self._minimum_zoom_percent)
         if name == 'zoom_scroll_remainder':
             return convert_float(self._read_field(self._zoom_scroll_remainder))
         if name == 'preferred_size':
             return Size(self._mdmp, self._preferred_size.va)
         if name == 'delayed_open_url_params':
-            _ = convert_int(self._read_field(self._delayed_open_url_params))
+            _ = self._value(self._delayed_open_url_params)
             return OpenURLParams(self._mdmp, _) if validate_pointer(self._mdmp, _, False) else None
         if name == 'delayed_load_url_params':
-            _ = convert_int(self._read_field(self._delayed_load_url_params))
+            _ = self._value(self._delayed_load_url_params)
             return LoadURLParams(self._mdmp, _) if validate_pointer(self._mdmp, _, False) else None
         if name == 'currently_playing_video_count':
-            return convert_int(self._read_field(self._currently_playing_video_count))
+            return self._value(self._currently_playing_video_count)
         if name == 'should_override_user_agent_in_new_tabs': 
-            return convert_bool(self._read_field(self._should_override_user_agent_in_new_tabs))
+            return bool(self._value(self._should_override_user_agent_in_new_tabs))
         if name == 'renderer_initiated_user_agent_override_option': 
             return self.UserAgentOverrideOption(
-            convert_int(self._read_field(self._renderer_initiated_user_agent_override_option)))
+            self._value(self._renderer_initiated_user_agent_override_option))
         if name == 'using_dark_colors':
-            return convert_bool(self._read_field(self._using_dark_colors))
+            return bool(self._value(self._using_dark_colors))
         if name == 'last_screen_orientation_change_time': 
-            return TimeTicks(convert_int(self._read_field(self._last_screen_orientation_change_time)))
+            return TimeTicks(self._value(self._last_screen_orientation_change_time))
         if name == 'page_base_background_color':
             absl_opt = Optional(self._mdmp, self._base+0x10C8, 4)
             return int.from_bytes(absl_opt.data, 'little') if absl_opt.engaged else 0
@@ -284,9 +284,9 @@ class WebContents(ChromiumInstanceInterface):
             assert self.primary_frame_tree.validate(debug), "INVALID FrameTree (primary_frame_tree)"
             assert self.maximum_zoom_percent == 500, "INVALID integer (maximum_zoom_percent)"
             assert self.minimum_zoom_percent == 25, "INVALID integer (minimum_zoom_percent)"
-            assert validate_boolean(convert_int(self._read_field(self._opened_by_another_window))), "INVALID bool (opened_by_another_window)"
-            assert validate_boolean(convert_int(self._read_field(self._should_override_user_agent_in_new_tabs))), "INVALID bool (should_override_user_agent_in_new_tabs)"
-            assert validate_boolean(convert_int(self._read_field(self._using_dark_colors))), "INVALID bool (using_dark_color)"
+            assert validate_boolean(self._value(self._opened_by_another_window)), "INVALID bool (opened_by_another_window)"
+            assert validate_boolean(self._value(self._should_override_user_agent_in_new_tabs)), "INVALID bool (should_override_user_agent_in_new_tabs)"
+            assert validate_boolean(self._value(self._using_dark_colors)), "INVALID bool (using_dark_color)"
         except Exception as e:
             if debug: print('WebContents -> 0x{0:X} {1}'.format(self.base, e))
             return False
@@ -310,23 +310,23 @@ class FrameTree(ChromiumInstanceInterface):
         if name == 'navigator':
             return Navigator(self._mdmp, self._navigator.va)
         if name == 'type':
-            return self.Type(convert_int(self._read_field(self._type)))
+            return self.Type(self._value(self._type))
         if name == 'load_progress':
             return convert_float(self._read_field(self._load_progress))
         if name == 'has_accessed_initial_main_document':
-            return convert_bool(self._read_field(self._has_accessed_initial_main_document))
+            return bool(self._value(self._has_accessed_initial_main_document))
         if name == 'is_being_destroyed':
-            return convert_bool(self._read_field(self._is_being_destroyed))
+            return bool(self._value(self._is_being_destroyed))
         if name == 'was_shut_down':
-            return convert_bool(self._read_field(self._was_shut_down))
+            return bool(self._value(self._was_shut_down))
 
     def validate(self, debug=False):
         try:
             assert self.navigator.validate(debug), 'INVALID Navigator (navigator)'
             assert self.type.value < 3, "INVALID Type (type)"
-            assert validate_boolean(convert_int(self._read_field(self._has_accessed_initial_main_document))), "INVALID bool (has_accessed_initial_main_document)"
-            assert validate_boolean(convert_int(self._read_field(self._is_being_destroyed))), "INVALID bool (is_being_destroyed)"
-            assert validate_boolean(convert_int(self._read_field(self._was_shut_down))), "INVALID bool (was_shut_down)"
+            assert validate_boolean(self._value(self._has_accessed_initial_main_document)), "INVALID bool (has_accessed_initial_main_document)"
+            assert validate_boolean(self._value(self._is_being_destroyed)), "INVALID bool (is_being_destroyed)"
+            assert validate_boolean(self._value(self._was_shut_down)), "INVALID bool (was_shut_down)"
         except Exception as e:
             if debug: print('FrameTree -> 0x{0:X} {1}'.format(self.base, e))
             return False
@@ -345,9 +345,9 @@ class Navigator(ChromiumInstanceInterface):
         if name == 'controller':
             return NavigationController(self._mdmp, self._controller.va)
         if name == 'delegate':
-            return convert_int(self._read_field(self._delegate))
+            return self._value(self._delegate)
         if name == 'metrics_data':
-            _ = convert_int(self._read_field(self._metrics_data))
+            _ = self._value(self._metrics_data)
             return NavigationMetricsData(self._mdmp, _) if validate_pointer(self._mdmp, _, False) else None
     
     def validate(self, debug=False):
@@ -383,19 +383,19 @@ class NavigationController(ChromiumInstanceInterface):
         if name == 'entries': 
             return Vector(self._mdmp, self._entries.va, 8)
         if name == 'pending_entry': 
-            _ = convert_int(self._read_field(self._pending_entry))
+            _ = self._value(self._pending_entry)
             return NavigationEntry(self._mdmp, _) if validate_pointer(self._mdmp, _, False) else None
         if name == 'failed_pending_entry_id': 
-            return convert_int(self._read_field(self._failed_pending_entry_id))
+            return self._value(self._failed_pending_entry_id)
         if name == 'last_committed_entry_index': # 여러 엔트리 중 사용자가 마지막으로 보고 있던 엔트리
-            return convert_int(self._read_field(self._last_committed_entry_index), signed=True)
+            return self._value(self._last_committed_entry_index, signed=True)
         if name == 'needs_reload': 
-            return convert_bool(self._read_field(self._needs_reload))
+            return bool(self._value(self._needs_reload))
         if name == 'needs_reload_type': 
-            _ = convert_int(self._read_field(self._needs_reload_type))
+            _ = self._value(self._needs_reload_type)
             return self.NeedsReloadType(_)
         if name == 'pending_reload':
-            _ = convert_int(self._read_field(self._pending_reload))
+            _ = self._value(self._pending_reload)
             return self.ReloadType(_)
 
     def validate(self, debug=False):
@@ -425,9 +425,9 @@ class NavigationEntry(ChromiumInstanceInterface):
         
         def __getattr__(self, name):
             if name == 'parent':
-                return convert_int(self._read_field(self._parent))
+                return self._value(self._parent)
             if name == 'frame_entry':
-                _ = convert_int(self._read_field(self._frame_entry))
+                _ = self._value(self._frame_entry)
                 return FrameNavigationEntry(self._mdmp, _)
             if name == 'children':
                 return Vector(self._mdmp, self._children.va, 8)
@@ -489,12 +489,12 @@ class NavigationEntry(ChromiumInstanceInterface):
     
     def __getattr__(self, name):
         if name == 'frame_tree':
-            _ = convert_int(self._read_field(self._frame_tree))
+            _ = self._value(self._frame_tree)
             return self.TreeNode(self._mdmp, _)
         if name == 'unique_id':
-            return convert_int(self._read_field(self._unique_id), signed=True)
+            return self._value(self._unique_id, signed=True)
         if name == 'page_type':
-            return self.PageType(convert_int(self._read_field(self._page_type)))
+            return self.PageType(self._value(self._page_type))
         if name == 'virtual_url':
             return GURL(self._mdmp, self._virtual_url.va)
         if name == 'title':
@@ -517,15 +517,15 @@ class NavigationEntry(ChromiumInstanceInterface):
         if name == 'user_typed_url':
             return GURL(self._mdmp, self._user_typed_url.va)
         if name == 'restore_type':
-            return self.RestoreType(convert_int(self._read_field(self._restore_type)))
+            return self.RestoreType(self._value(self._restore_type))
         if name == 'original_request_url':
             return GURL(self._mdmp, self._original_request_url.va)
         if name == 'is_overriding_user_agent':
-            return convert_bool(self._read_field(self._is_overriding_user_agent))
+            return bool(self._value(self._is_overriding_user_agent))
         if name == 'timestamp':
-            return Time(convert_int(self._read_field(self._timestamp)))
+            return Time(self._value(self._timestamp))
         if name == 'http_status_code':
-            return convert_int(self._read_field(self._http_status_code), signed=True)
+            return self._value(self._http_status_code, signed=True)
         if name == 'extra_headers':
             return U8String(self._mdmp, self._extra_headers.va)
         if name == 'base_url_for_data_url':
@@ -533,11 +533,11 @@ class NavigationEntry(ChromiumInstanceInterface):
         if name == 'cached_display_title':
             return U16String(self._mdmp, self._cached_display_title.va)
         if name == 'should_clear_history_list':
-            return convert_bool(self._read_field(self._should_clear_history_list))
+            return bool(self._value(self._should_clear_history_list))
         if name == 'reload_type':
-            return self.ReloadType(convert_int(self._read_field(self._reload_type)))
+            return self.ReloadType(self._value(self._reload_type))
         if name == 'ssl_error':
-            return convert_bool(self._read_field(self._ssl_error))
+            return bool(self._value(self._ssl_error))
     
     def validate(self, debug=False):
         try:
@@ -553,9 +553,9 @@ class NavigationEntry(ChromiumInstanceInterface):
             assert self.timestamp.validate(debug=debug)
             assert 100 <= self.http_status_code < 600, "INVALID integer (http_status_code)"
             assert self.base_url_for_data_url.validate(debug), "INVALID GURL (base_url_for_data_url)"
-            assert validate_boolean(convert_int(self._read_field(self._is_overriding_user_agent))), "INVALID bool (is_overriding_user_agent)"
-            assert validate_boolean(convert_int(self._read_field(self._should_clear_history_list))), "INVALID bool (should_clear_history_list)"
-            assert validate_boolean(convert_int(self._read_field(self._ssl_error))), "INVALID bool (ssl_error)"
+            assert validate_boolean(self._value(self._is_overriding_user_agent)), "INVALID bool (is_overriding_user_agent)"
+            assert validate_boolean(self._value(self._should_clear_history_list)), "INVALID bool (should_clear_history_list)"
+            assert validate_boolean(self._value(self._ssl_error)), "INVALID bool (ssl_error)"
         except Exception as e:
             if debug:
                 print('NavigationEntry -> 0x{0:X} {1}'.format(self.base, e))
@@ -574,19 +574,19 @@ class FrameNavigationEntry(ChromiumInstanceInterface):
     
     def __getattr__(self, name):
         if name == 'ref_count':
-            return convert_int(self._read_field(self._ref_count))
+            return self._value(self._ref_count)
         if name == 'frame_unique_name':
             return U8String(self._mdmp, self._frame_unique_name.va)
         if name == 'item_sequence_number':
-            return convert_int(self._read_field(self._item_sequence_number))
+            return self._value(self._item_sequence_number)
         if name == 'document_sequence_number':
-            return convert_int(self._read_field(self._document_sequence_number))
+            return self._value(self._document_sequence_number)
         if name == 'navigation_api_key':
             return U8String(self._mdmp, self._navigation_api_key.va)
         if name == 'site_instance':
-            return convert_int(self._read_field(self._site_instance))
+            return self._value(self._site_instance)
         if name == 'source_site_instance':
-            return convert_int(self._read_field(self._source_site_instance))
+            return self._value(self._source_site_instance)
         if name == 'url':
             return GURL(self._mdmp, self._url.va)
         if name == 'referrer': 
@@ -594,11 +594,11 @@ class FrameNavigationEntry(ChromiumInstanceInterface):
         if name == 'redirect_chain':
             return Vector(self._mdmp, self._redirect_chain.va, 120)
         if name == 'bindings':
-            return convert_int(self._read_field(self._bindings))
+            return self._value(self._bindings)
         if name == 'method':
             return U8String(self._mdmp, self._method.va)
         if name == 'post_id':
-            return convert_int(self._read_field(self._post_id))
+            return self._value(self._post_id)
     
     def validate(self, debug=False):
         try:
@@ -622,7 +622,7 @@ class NavigationMetricsData(ChromiumInstanceInterface):
     
     def __getattr__(self, name):
         if name == 'start_time':
-            return TimeTicks(convert_int(self._read_field(self._start_time)))
+            return TimeTicks(self._value(self._start_time))
         if name == 'url':
             return GURL(self._mdmp, self._url.va)
 
@@ -674,19 +674,19 @@ class OpenURLParams(ChromiumInstanceInterface):
         if name == 'referrer':
             return Referrer(self._mdmp, self._referrer.va)
         if name == 'initiator_process_id':
-            return convert_int(self._read_field(self._initiator_process_id))
+            return self._value(self._initiator_process_id)
         if name == 'redirect_chain':
             return Vector(self._mdmp, self._redirect_chain.va)
         if name == 'extra_headers':
             return U8String(self._mdmp, self._extra_headers.va)
         if name == 'transition':
-            return self.PageTransition(convert_int(self._read_field(self._transition)))
+            return self.PageTransition(self._value(self._transition))
         if name == 'href_translate':
             return U8String(self._mdmp, self._href_translate.va)
         if name == 'reload_type':
-            return self.ReloadType(convert_int(self._read_field(self._reload_type)))
+            return self.ReloadType(self._value(self._reload_type))
         if name == 'is_pdf':
-            return convert_bool(self._read_field(self._is_pdf))
+            return bool(self._value(self._is_pdf))
 
 
 
@@ -746,11 +746,11 @@ class LoadURLParams(ChromiumInstanceInterface):
         if name == 'url':
             return GURL(self._mdmp, self._url.va)
         if name == 'initiator_process_id':
-            return convert_int(self._read_field(self._initiator_process_id))
+            return self._value(self._initiator_process_id)
         if name == 'load_type':
-            return self.LoadURLType(convert_int(self._read_field(self._load_type)))
+            return self.LoadURLType(self._value(self._load_type))
         if name == 'transition_type':
-            transition_type = convert_int(self._read_field(self._transition_type))
+            transition_type = self._value(self._transition_type)
             page_trans_core = self.PageTransition(transition_type & self.PageTransition.PAGE_TRANSITION_CORE_MASK.value)
             page_trans_is_redir = self.PageTransition(transition_type & self.PageTransition.PAGE_TRANSITION_IS_REDIRECT_MASK.value)
             page_trans_qualifier = self.PageTransition(transition_type & self.PageTransition.PAGE_TRANSITION_QUALIFIER_MASK.value)
@@ -767,7 +767,7 @@ class LoadURLParams(ChromiumInstanceInterface):
         if name == 'extra_headers':
             return U8String(self._mdmp, self._extra_headers.va)
         if name == 'override_user_agent':
-            return self.UserAgentOverrideOption(convert_int(self._read_field(self._override_user_agent)))
+            return self.UserAgentOverrideOption(self._value(self._override_user_agent))
         if name == 'base_url_for_data_url':
             return GURL(self._mdmp, self._base_url_for_data_url.va)
         if name == 'virtual_url_for_data_url':
@@ -775,11 +775,11 @@ class LoadURLParams(ChromiumInstanceInterface):
         if name == 'post_content_type':
             return U8String(self._mdmp, self._post_content_type.va)
         if name == 'reload_type':
-            return self.ReloadType(convert_int(self._read_field(self._reload_type)))
+            return self.ReloadType(self._value(self._reload_type))
         if name == 'is_form_submission':
-            return convert_bool(self._read_field(self._is_form_submission))
+            return bool(self._value(self._is_form_submission))
         if name == 'is_pdf':
-            return convert_bool(self._read_field(self._is_pdf))
+            return bool(self._value(self._is_pdf))
 
 
 
@@ -22,19 +22,19 @@ class GURL(ChromiumInstanceInterface):
         if name == 'spec':
             return U8String(self._mdmp, self._spec.va)
         if name == 'is_valid':
-            return convert_bool(self._read_field(self._is_valid))
+            return bool(self._value(self._is_valid))
         if name == 'parsed':
             return Parsed(self._mdmp, self._parsed.va)
         if name == 'inner_url':
-            _ = convert_int(self._read_field(self._inner_url))
+            _ = self._value(self._inner_url)
             return GURL(self._mdmp, _) if _ else None
     
     def validate(self, debug=False):
         try:
             assert self.spec.validate(debug), "INVALID std::string (spec)"
-            assert validate_boolean(convert_int(self._read_field(self._is_valid))), "INVALID bool (is_valid)"
+            assert validate_boolean(self._value(self._is_valid)), "INVALID bool (is_valid)"
             assert self.parsed.validate(debug), "INVALID url::Parsed (parsed)"
-            if convert_int(self._read_field(self._inner_url)):
+            if self._value(self._inner_url):
                 assert self.inner_url.validate(debug), "INVALID url::GURL (inner_url)"
         except Exception as e:
             if debug: print('url::GURL -> 0x{0:X} {1}'.format(self.base, e))
@@ -55,9 +55,9 @@ class Component(ChromiumInstanceInterface):
 
     def __getattr__(self, name):
         if name == 'begin':
-            return convert_int(self._read_field(self._begin), signed=True)
+            return self._value(self._begin, signed=True)
         if name == 'len':
-            return convert_int(self._read_field(self._len), signed=True)
+            return self._value(self._len, signed=True)
 
     def validate(self, debug=False):
         try:
@@ -95,9 +95,9 @@ class Parsed(ChromiumInstanceInterface):
         if name == 'ref':
             return Component(self._mdmp, self._ref.va)
         if name == 'potentially_dangling_markup':
-            return convert_bool(self._read_field(self._potentially_dangling_markup))
+            return bool(self._value(self._potentially_dangling_markup))
         if name == 'inner_parsed':
-            return Parsed(self._mdmp, convert_int(self._read_field(self._inner_parsed)))
+            return Parsed(self._mdmp, self._value(self._inner_parsed))
     
     def validate(self, debug=False):
         try:
@@ -109,7 +109,7 @@ class Parsed(ChromiumInstanceInterface):
             assert self.path.validate(debug), "INVALID url::Component (path)"
             assert self.query.validate(debug), "INVALID url::Component (query)"
             assert self.ref.validate(debug), "INVALID url::Component (ref)"
-            assert validate_boolean(convert_int(self._read_field(self._potentially_dangling_markup))), "INVALID bool (potentially_dangling_markup)"
+            assert validate_boolean(self._value(self._potentially_dangling_markup)), "INVALID bool (potentially_dangling_markup)"
         except Exception as e:
             if debug: print('url::Parsed -> 0x{0:X} {1}'.format(self.base, e))
             return False
@@ -128,7 +128,7 @@ class Referrer(ChromiumInstanceInterface):
         if name == 'url':
             return GURL(self._mdmp, self._url.va)
         if name == 'policy':
-            return convert_int(self._read_field(self._policy))
+            return self._value(self._policy)
     
     def validate(self, debug=False):
         try:
@@ -174,7 +174,7 @@ class SchemeHostPort(ChromiumInstanceInterface):
         if name == 'host':
             return U8String(self._mdmp, self._host.va)
         if name == 'port':
-            return convert_int(self._read_field(self._port))
+            return self._value(self._port)
 
     def validate(self, debug=False):
         try:
@@ -197,15 +197,15 @@ class FaviconStatus(ChromiumInstanceInterface):
     
     def __getattr__(self, name):
         if name == 'valid':
-            return convert_bool(self._read_field(self._valid))
+            return bool(self._value(self._valid))
         if name == 'url':
             return GURL(self._mdmp, self._url.va)
         if name == 'image':
-            return Image(self._mdmp, convert_int(self._read_field(self._image)))
+            return Image(self._mdmp, self._value(self._image))
 
     def validate(self, debug=False):
         try:
-            assert validate_boolean(convert_int(self._read_field(self._valid))), "INVALID bool (valid)"
+            assert validate_boolean(self._value(self._valid)), "INVALID bool (valid)"
             assert self.url.validate(debug), "INVALID url::GURL (url)"
             assert self.image.validate(debug), "INVALID gfx::Image (image)"
         except Exception as e:
@@ -231,31 +231,31 @@ class SSLStatus(ChromiumInstanceInterface):
     
     def __getattr__(self, name):
         if name == 'initialized':
-            return convert_bool(self._read_field(self._initialized))
+            return bool(self._value(self._initialized))
         if name == 'certificate':
-            _ = convert_int(self._read_field(self._certificate))
+            _ = self._value(self._certificate)
             return X509Certificate(self._mdmp, _) if validate_pointer(self._mdmp, _, False) else None
         if name == 'cert_status':
-            return convert_int(self._read_field(self._cert_status))
+            return self._value(self._cert_status)
         if name == 'key_exchange_group':
-            return convert_int(self._read_field(self._key_exchange_group))
+            return self._value(self._key_exchange_group)
         if name == 'peer_signature_algorithm':
-            return convert_int(self._read_field(self._peer_signature_algorithm))
+            return self._value(self._peer_signature_algorithm)
         if name == 'connection_status':
-            return convert_int(self._read_field(self._connection_status))
+            return self._value(self._connection_status)
         if name == 'content_status':
-            return convert_int(self._read_field(self._content_status))
+            return self._value(self._content_status)
         if name == 'pkp_bypassed':
-            return convert_bool(self._read_field(self._pkp_bypassed))
+            return bool(self._value(self._pkp_bypassed))
         if name == 'ct_policy_compliance':
-            return self.CTPolicyCompliance(convert_int(self._read_field(self._ct_policy_compliance)))
+            return self.CTPolicyCompliance(self._value(self._ct_policy_compliance))
     
     def validate(self, debug=False):
         try:
-            assert validate_boolean(convert_int(self._read_field(self._initialized))), "INVALID bool (initialized)"
+            assert validate_boolean(self._value(self._initialized)), "INVALID bool (initialized)"
             c = self.certificate
             if c: assert c.validate(debug), "INVALID net::X509Certificate (certificate)"
-            assert validate_boolean(convert_int(self._read_field(self._pkp_bypassed))), "INVALID bool (pkp_bypassed)"
+            assert validate_boolean(self._value(self._pkp_bypassed)), "INVALID bool (pkp_bypassed)"
             assert self.ct_policy_compliance.value < 5, 'INVALID CTPolicyCompliance (ct_policy_compliance)'
         except Exception as e:
             if debug: print('content::SSLStatus -> 0x{0:X} {1}'.format(self.base, e))
@@ -277,9 +277,9 @@ class X509Certificate(ChromiumInstanceInterface):
         if name == 'issuer':
             return CertPrincipal(self._mdmp, self._issuer.va)
         if name == 'valid_start':
-            return Time(convert_int(self._read_field(self._valid_start)))
+            return Time(self._value(self._valid_start))
         if name == 'valid_expiry':
-            return Time(convert_int(self._read_field(self._valid_expiry)))
+            return Time(self._value(self._valid_expiry))
         if name == 'serial_number':
             sn = ''
 
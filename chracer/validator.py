@@ -1,25 +1,114 @@
+import bisect
+import weakref
+import numpy as np
 from minidump.minidumpfile import MinidumpFile
 from minidump.streams import MemoryType, MemoryState, AllocationProtect
 
+from chracer.reader import get_reader
+
+_regions = weakref.WeakKeyDictionary()
+
+
+
+class MemoryRegions:
+    # memory_info and captured memory of a dump sorted by address, looked up by
+    # bisect (one address) or numpy.searchsorted (arrays of addresses)
+    def __init__(self, mdmp: MinidumpFile):
+        infos = mdmp.memory_info.infos if mdmp.memory_info else []
+        infos = sorted(infos, key=lambda m: m.BaseAddress)
+
+        self.bases = [m.BaseAddress for m in infos]
+        self.ends = [m.BaseAddress + m.RegionSize for m in infos]
+        self.types = [m.Type for m in infos]
+        self.states = [m.State for m in infos]
+        self.protects = [m.Protect for m in infos]
+
+        self._reader = get_reader(mdmp)
+        segments = self._reader.segments
+        self._segment_starts = np.array([_[0] for _ in segments], dtype=np.uint64)
+        self._segment_ends = np.array([_[1] for _ in segments], dtype=np.uint64)
+        self._bases = np.array(self.bases, dtype=np.uint64)
+        self._ends = np.array(self.ends, dtype=np.uint64)
+        self._rw_private = np.array([self._is_rw_private(i) for i in range(len(infos))], dtype=bool)
+
+    def _is_rw_private(self, i: int) -> bool:
+        return self.types[i] == MemoryType.MEM_PRIVATE \
+            and self.states[i] == MemoryState.MEM_COMMIT \
+            and self.protects[i] == AllocationProtect.PAGE_READWRITE
+
+    def find(self, va: int) -> int:
+        """index of the region containing va, otherwise -1"""
+        i = bisect.bisect_right(self.bases, va) - 1
+        if i < 0 or va >= self.ends[i]: return -1
+        return i
+
+    def protection(self, va: int):
+        """AllocationProtect of the captured memory at va, otherwise None"""
+        if not self.is_captured(va): return None
+        i = self.find(va)
+        return self.protects[i] if i >= 0 else None
+
+    def is_captured(self, va: int, size: int=1) -> bool:
+        return self._reader.contains(va, size)
+
+    def is_rw_private(self, va: int, inside=False) -> bool:
+        """va is in a private read/write region, past its base address if inside"""
+        i = self.find(va)
+        return i >= 0 and self._is_rw_private(i) and not (inside and va == self.bases[i])
+
+    @staticmethod
+    def _lookup(values: np.ndarray, starts: np.ndarray, ends: np.ndarray):
+        i = np.searchsorted(starts, values, side='right').astype(np.int64) - 1
+        hit = (i >= 0) & (values < ends[np.maximum(i, 0)]) if len(starts) else np.zeros(len(values), dtype=bool)
+        return i, hit
+
+    def are_captured(self, values) -> np.ndarray:
+        values = np.asarray(values, dtype=np.uint64)
+        return self._lookup(values, self._segment_starts, self._segment_ends)[1]
+
+    def are_rw_private(self, values, inside=False) -> np.ndarray:
+        values = np.asarray(values, dtype=np.uint64)
+        i, hit = self._lookup(values, self._bases, self._ends)
+        if not len(self._bases): return hit
+        hit &= self._rw_private[np.maximum(i, 0)]
+        if inside: hit &= values != self._bases[np.maximum(i, 0)]
+        return hit
+
+def get_regions(mdmp: MinidumpFile) -> MemoryRegions:
+    regions = _regions.get(mdmp)
+    if regions is None: regions = _regions[mdmp] = MemoryRegions(mdmp)
+    return regions
+
+
+
 def validate_pointer(mdmp: MinidumpFile, va: int, can_null=True) -> bool:
-    if can_null and va == 0: return True
-    if not can_null and va == 0: return False
-    if va < 0x800000000000: return True
-    try:
-        mdmp.get_reader().read(va, 1)
-    except:
-        return False
-    return True
+    if va == 0: return can_null
+    return get_regions(mdmp).is_captured(va)
+
+def validate_end_pointer(mdmp: MinidumpFile, va: int, can_null=True) -> bool:
+    """validate_pointer of a one-past-the-end pointer (e.g. std::vector end), which may sit right at the end of a region"""
+    if va == 0: return can_null
+    return get_regions(mdmp).is_captured(va - 1)
+
+def validate_pointers(mdmp: MinidumpFile, values, can_null=True) -> np.ndarray:
+    """validate_pointer of every value of an array at once"""
+    values = np.asarray(values, dtype=np.uint64)
+    return np.where(values == 0, can_null, get_regions(mdmp).are_captured(values))
 
 def validate_rw_page(mdmp: MinidumpFile, va: int) -> bool:
+    # strictly past the base of the region (BaseAddress < va), as it always was
     if va == 0: return False
-    for m in mdmp.memory_info.infos:
-        if m.BaseAddress < va < (m.BaseAddress + m.RegionSize) \
-        and m.Type == MemoryType.MEM_PRIVATE \
-        and m.State == MemoryState.MEM_COMMIT \
-        and m.Protect == AllocationProtect.PAGE_READWRITE:
-            return True
-    return False
+    return get_regions(mdmp).is_rw_private(va, inside=True)
+
+def validate_rw_end_page(mdmp: MinidumpFile, va: int) -> bool:
+    """validate_rw_page of a one-past-the-end pointer"""
+    if va == 0: return False
+    return get_regions(mdmp).is_rw_private(va - 1, inside=True)
+
+def validate_rw_pages(mdmp: MinidumpFile, values) -> np.ndarray:
+    """validate_rw_page of every value of an array at once"""
+    values = np.asarray(values, dtype=np.uint64)
+    return (values != 0) & get_regions(mdmp).are_rw_private(values, inside=True)
 
 def validate_boolean(value):
-    return value in (0, 1)
\ No newline at end of file
+    return value in (0, 1)
@@ -1,74 +1,48 @@
 import os
 import sys
-import tqdm
 import datetime
 from tabulate import tabulate
-from minidump.minidumpfile import MinidumpFile
 
-if len(sys.argv) != 2:
-    print('Usage: python {0} <minidump file>'.format(sys.argv[0]))
-    exit()
-if not os.path.exists(sys.argv[1]):
-    print('{0} is not exists'.format(sys.argv[1]))
-    exit()
+if __name__ == '__main__':
+    args = [_ for _ in sys.argv[1:] if _ != '--resume']
+    resume = len(args) != len(sys.argv) - 1
+    if len(args) != 1:
+        print('Usage: python {0} [--resume] <minidump file>'.format(sys.argv[0]))
+        exit()
+    if not os.path.exists(args[0]):
+        print('{0} is not exists'.format(args[0]))
+        exit()
 
 
 
-print('### start to load symbols at', datetime.datetime.now())
-from chracer.chromium import *
-print('### end to load symbols at', datetime.datetime.now())
+    print('### start to load symbols and minidump at', datetime.datetime.now())
+    from chracer.loader import load_dump
+    from chracer.chromium import *
+    from chracer.scanner import parallel_scan
 
+    mdmp, modules = load_dump(args[0])
+    for module in modules:
+        print('[NOTICE] using symbols matching', module)
+    print('### end to load symbols and minidump at', datetime.datetime.now())
 
 
-print('[NOTICE] The program is very slow because it hasn\'t been optimized yet.')
-print('### start to find Browser objects at', datetime.datetime.now())
 
-mdmp = MinidumpFile.parse(sys.argv[1])
-browser_instances = []
-for m in tqdm.tqdm(mdmp.memory_info.infos):
-    if m.Type == MemoryType.MEM_PRIVATE \
-    and m.State == MemoryState.MEM_COMMIT \
-    and m.Protect == AllocationProtect.PAGE_READWRITE:
-        
-        for addr in range(m.BaseAddress, m.BaseAddress + m.RegionSize - Browser.instance_size(), 8):
-            b = Browser(mdmp, addr)
-            if not b.validate(): continue
+    print('### start to find Browser objects at', datetime.datetime.now())
 
-            tabs = b.tab_strip_model.contents_data.entries
-            if len(tabs) < 1: continue
+    browser_instances = parallel_scan(mdmp, Browser, accept=has_navigation, progress=True,
+        checkpoint='checkpoints', resume=resume)
 
-            tab = Tab(mdmp, int.from_bytes(tabs[0], 'little'))
-            if not tab.validate(): continue
+    print('### end to find Browser objects at', datetime.datetime.now())
 
-            entries = tab.contents.primary_frame_tree.navigator.controller.entries.entries
-            if len(entries) < 1: continue
-            
-            entry = NavigationEntry(mdmp, int.from_bytes(entries[0], 'little'))
-            if not entry.validate(): continue
-            
-            browser_instances.append(b)
 
-print('### end to find Browser objects at', datetime.datetime.now())
 
+    print('### start to extract information at', datetime.datetime.now())
 
+    hdr = ['SessionID', 'Tab', 'Time', 'Title', 'URL']
+    body = []
+    for b, ti, e, fe in walk_entries(mdmp, browser_instances):
+        body.append((b.session_id, ti, e.timestamp.to_datetime(), e.title.string, fe.url.spec.string))
 
-print('### start to extract information at', datetime.datetime.now())
+    print('### end to extract information at', datetime.datetime.now())
 
-hdr = ['SessionID', 'Tab', 'Time', 'Title', 'URL']
-body = []
-for b in browser_instances:
-    for ti, tp in enumerate(b.tab_strip_model.contents_data.entries):
-        t = Tab(mdmp, int.from_bytes(tp, 'little'))
-        w = t.contents
-        f = w.primary_frame_tree
-        n = f.navigator
-        nc = n.controller
-
-        for ei, ep in enumerate(nc.entries.entries):
-            e = NavigationEntry(mdmp, int.from_bytes(ep, 'little'))
-            fe = e.frame_tree.frame_entry
-            body.append((b.session_id, ti, e.timestamp.to_datetime(), e.title.string, fe.url.spec.string))
-
-print('### end to extract information at', datetime.datetime.now())
-
-print(tabulate(body, headers=hdr))
\ No newline at end of file
+    print(tabulate(body, headers=hdr))
\ No newline at end of file